@@ -1,4 +1,5 @@
 import asyncio
+import functools
 from io import BufferedIOBase
 import logging
 import socket
@@ -19,6 +20,8 @@ from ..pdu import (
     TransparentRequest,
     TransparentResponse,
     WriteHoldingRegisterResponse,
+    WriteHoldingRegistersRequest,
+    WriteHoldingRegistersResponse,
 )
 
 _logger = logging.getLogger(__name__)
@@ -129,13 +132,14 @@ class Client:
 
         return self.plant
 
-    @property
+    @functools.cached_property
     def commands(self):
         """Access to the library of commands."""
 
         # defer import until here to avoid circularity
         from .commands import Commands
 
+        # Commands holds no state beyond the client, so one instance will do
         return Commands(self)
 
     async def watch_plant(
@@ -223,7 +227,10 @@ class Client:
                         "Received unexpected message type for a client: %s", message
                     )
                     continue
-                if isinstance(message, WriteHoldingRegisterResponse):
+                if isinstance(
+                    message,
+                    (WriteHoldingRegisterResponse, WriteHoldingRegistersResponse),
+                ):
                     if message.error:
                         _logger.warning("%s", message)
                     else:
@@ -313,6 +320,9 @@ class Client:
                     if response.error:
                         _logger.error("Received error response, retrying: %s", response)
                     else:
+                        if isinstance(request, WriteHoldingRegistersRequest):
+                            # the ack doesn't carry the values written
+                            self.plant.apply_write(request)
                         return response
             except asyncio.TimeoutError:
                 pass
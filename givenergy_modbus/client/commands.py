@@ -8,7 +8,9 @@ They simply prepare sequences of requests that need to be sent using
 the client.
 """
 
+import functools
 import logging
+import sys
 from datetime import datetime
 from textwrap import dedent
 from typing import Any, Callable, Optional
@@ -21,23 +23,152 @@ from ..model import TimeSlot
 from ..model.inverter import (
     Inverter,
 )
-from ..model.register import DynamicDoc
+from ..model.register import HR, DynamicDoc
 from ..pdu import (
     ReadHoldingRegistersRequest,
     ReadInputRegistersRequest,
+    ReadRegistersRequest,
     TransparentRequest,
     WriteHoldingRegisterRequest,
+    WriteHoldingRegistersRequest,
 )
 
 _logger = logging.getLogger(__name__)
 
 
+def _make_setter(name: str) -> Callable:
+    """Make a set_xyz(value) method for Commands."""
+
+    def setter(self, value: Any) -> list[TransparentRequest]:
+        return self._set_helper(name, value)
+
+    setter.__name__ = setter.__qualname__ = "set_" + name
+    return setter
+
+
+def _make_resetter(name: str) -> Callable:
+    """Make a reset_x_slot_y() method for Commands."""
+
+    def resetter(self) -> list[TransparentRequest]:
+        return self._set_timeslot(name, None)
+
+    resetter.__name__ = resetter.__qualname__ = "reset_" + name
+    return resetter
+
+
+def _build_method_table() -> dict[str, Callable]:
+    """Work out the full set of fabricated methods from the register definitions.
+
+    Every writable register gets a set_xyz(), and each writable
+    x_slot_y_start/end register pair also gets set_x_slot_y() and
+    reset_x_slot_y().
+    """
+    table = {}
+    for reg, defn in Inverter.REGISTER_LUT.items():
+        if defn.valid is not None:
+            table['set_' + reg] = _make_setter(reg)
+            if '_slot_' in reg and reg.endswith('_end'):
+                # The register names are all literals, so already interned,
+                # but the derived slot name is not.
+                slot = sys.intern(reg[:-4])
+                table['set_' + slot] = _make_setter(slot)
+                table['reset_' + slot] = _make_resetter(slot)
+    return table
+
+
+# time slot name -> names of its start and end registers
+_SLOT_REGISTERS: dict[str, tuple[str, str]] = {
+    sys.intern(reg[:-4]): (sys.intern(reg[:-4] + '_start'), reg)
+    for reg, defn in Inverter.REGISTER_LUT.items()
+    if defn.valid is not None and '_slot_' in reg and reg.endswith('_end')
+}
+
+
+def _coalesce(requests: list[TransparentRequest]) -> list[TransparentRequest]:
+    """Merge runs of writes to adjacent holding registers.
+
+    Each run of two or more consecutive WriteHoldingRegisterRequests, in
+    the order given, to ascending adjacent registers on the same slave
+    becomes a single WriteHoldingRegistersRequest. Nothing is reordered:
+    other requests, and writes that don't continue a run, are passed
+    through unchanged and in place.
+    """
+    ret: list[TransparentRequest] = []
+    run: list[WriteHoldingRegisterRequest] = []
+
+    def flush():
+        if len(run) == 1:
+            ret.append(run[0])
+        elif run:
+            ret.append(
+                WriteHoldingRegistersRequest(
+                    run[0].register,
+                    [r.value for r in run],
+                    slave_address=run[0].slave_address,
+                )
+            )
+        run.clear()
+
+    for req in requests:
+        if not isinstance(req, WriteHoldingRegisterRequest):
+            flush()
+            ret.append(req)
+            continue
+        if run and not (
+            req.slave_address == run[-1].slave_address
+            and req.register == run[-1].register + 1
+        ):
+            flush()
+        run.append(req)
+    flush()
+    return ret
+
+
+# Largest number of registers to ask for in one read. Modbus itself
+# allows up to 125, but the inverter only answers requests for up to 60,
+# and ReadRegistersRequest.ensure_valid_state() enforces that.
+_READ_CHUNK = 60
+
+
+def _chunked_reads(
+    cls: type[ReadRegistersRequest], start: int, end: int
+) -> tuple[tuple[type[ReadRegistersRequest], int, int], ...]:
+    """Split the register span [start, end) into (cls, base, count) reads."""
+    return tuple(
+        (cls, base, min(_READ_CHUNK, end - base))
+        for base in range(start, end, _READ_CHUNK)
+    )
+
+
+# (request class, base register, register count) for the inverter
+# register blocks read by refresh_plant_data(), on every refresh and
+# in addition on a complete refresh. All are for slave address 0x32.
+_REFRESH_REQUESTS = (
+    _chunked_reads(ReadInputRegistersRequest, 0, 60)
+    + _chunked_reads(ReadInputRegistersRequest, 180, 240)
+)
+_COMPLETE_REFRESH_REQUESTS = (
+    _chunked_reads(ReadHoldingRegistersRequest, 0, 180)
+    + _chunked_reads(ReadInputRegistersRequest, 120, 180)
+)
+
+
+# Register indices for set_system_date_time(), in year..second order.
+_SYSTEM_TIME_REGISTERS = tuple(
+    Inverter.lookup_writable_register('system_time_' + part)
+    for part in ('year', 'month', 'day', 'hour', 'minute', 'second')
+)
+
+
 class Commands(metaclass=DynamicDoc):
     # pylint: disable=missing-class-docstring
     # The metaclass turns accesses to __doc__ into calls to _gendoc()
 
     _DOC = """High-level methods for interacting with a remote system."""
 
+    # name -> function for every method that __getattr__ can fabricate
+    _METHOD_TABLE: dict[str, Callable] = _build_method_table()
+
     def __init__(self, client: Client):
         self.client = client
 
@@ -49,6 +180,46 @@ class Commands(metaclass=DynamicDoc):
         idx = Inverter.lookup_writable_register(name, value)
         return WriteHoldingRegisterRequest(idx, value)
 
+    def skip_unchanged(
+        self, requests: list[TransparentRequest]
+    ) -> list[TransparentRequest]:
+        """Drop register writes that would not change the inverter's state.
+
+        A write is dropped if the client's cached copy of the inverter's
+        holding registers already holds every value it would write.
+        This is only as reliable as the cache is fresh, so it is up to
+        the caller to decide when it's appropriate, eg:
+
+            client.commands.skip_unchanged(client.commands.set_mode_storage())
+        """
+        cache = self.client.plant.register_caches.get(0x32)
+        if not cache:
+            return list(requests)
+        ret = []
+        for req in requests:
+            if isinstance(req, WriteHoldingRegisterRequest):
+                if cache.get(HR(req.register)) == req.value:
+                    continue
+            elif isinstance(req, WriteHoldingRegistersRequest):
+                regs = range(req.base_register, req.base_register + req.register_count)
+                if [cache.get(HR(r)) for r in regs] == req.register_values:
+                    continue
+            ret.append(req)
+        return ret
+
+    def coalesce(
+        self, requests: list[TransparentRequest]
+    ) -> list[TransparentRequest]:
+        """Merge runs of writes to adjacent registers into write-multiple requests.
+
+        This is opt-in: the write-multiple (function 16) encoding has not yet
+        been checked against a capture from a real inverter. See _coalesce()
+        for exactly which writes get merged, eg:
+
+            client.commands.coalesce(client.commands.set_system_date_time(dt))
+        """
+        return _coalesce(requests)
+
     # rather than writing lots of trivial setter methods,
     # this translates implicit commands into calls to helpers:
     #   commands.set_xyz(value) -> commands._set_helper('xyz', value)
@@ -58,18 +229,19 @@ class Commands(metaclass=DynamicDoc):
     # Invoking commands.xyz(value) is a two-step process:
     #  callable = getattr(commands, 'xyz')
     #  callable(value)
-    # so __getattr__ returns a lambda that supplies the name and
-    # takes the value as a parameter.
+    # so we need a function that supplies the name and takes the value
+    # as a parameter. Those are all prepared up front in _METHOD_TABLE.
+    # __getattr__ installs the one requested on the class, so it only
+    # runs the first time a given name is used; subsequent lookups (on
+    # any instance) find an ordinary method.
 
     def __getattr__(self, name: str) -> Callable:
         """Fabricate a set_xyz() or reset_x_slot_y() method."""
-        if name.startswith("reset_") and "_slot" in name:
-            if name[6:] in Inverter.REGISTER_LUT:
-                return lambda: self._set_timeslot(name[6:], None)
-        elif name.startswith("set_"):
-            if name[4:] in Inverter.REGISTER_LUT:
-                return lambda value: self._set_helper(name[4:], value)
-        raise AttributeError(f"No {name} in {__name__}")
+        fn = type(self)._METHOD_TABLE.get(name)
+        if fn is None:
+            raise AttributeError(f"No {name} in {__name__}")
+        setattr(type(self), name, fn)
+        return getattr(self, name)
 
     # This is a generic register setter, usually invokved via __getattr__
 
@@ -80,13 +252,20 @@ class Commands(metaclass=DynamicDoc):
         is a TimeSlot, in which case it calls _set_timeslot().
         """
         _logger.debug("commands._set_helper: %s %s", name, value)
-        if isinstance(value, TimeSlot):
+        value_type = type(value)
+        if value_type is int:
+            # the common case, which needs no conversion
+            return [self.write_named_register(name, value)]
+        # exact type check first: subclasses are rare, so avoid the MRO walk
+        if value_type is TimeSlot or isinstance(value, TimeSlot):
             return self._set_timeslot(name, value)
-        # Otherwise just a single register access
+        # Otherwise just a single register access. Note that this converts
+        # bools too, so that requests always carry a plain int.
         return [self.write_named_register(name, int(value))]
 
     # A helper to write a timeslot to a pair of adjacent time registers
-    # Assumes the time registers are called {name}_start and {name}_end
+    # The time registers are called {name}_start and {name}_end, and
+    # are looked up in _SLOT_REGISTERS
 
     def _set_timeslot(
         self, name: str, value: TimeSlot | None
@@ -96,78 +275,55 @@ class Commands(metaclass=DynamicDoc):
         A value of None is interpreted to mean TimeSlot(0,0,0,0).
         """
         if value is None:
-            start = 0
-            end = 0
+            start = end = 0
         else:
-            start = 100 * value.start.hour + value.start.minute
-            end = 100 * value.end.hour + value.end.minute
+            start, end = value.start_hhmm, value.end_hhmm
+        start_reg, end_reg = _SLOT_REGISTERS[name]
+        # Slot writes are sent as two single-register writes, which are
+        # known to work on real inverters. They are not merged into one
+        # write-multiple request.
         return [
-            self.write_named_register(name + "_start", start),
-            self.write_named_register(name + "_end", end),
+            self.write_named_register(start_reg, start),
+            self.write_named_register(end_reg, end),
         ]
 
     def refresh_plant_data(
         self, complete: bool, number_batteries: int = 1, max_batteries: int = 5
     ) -> list[TransparentRequest]:
         """Refresh plant data."""
+        # The requests are mutable, and get encoded concurrently by
+        # Client.execute(), so each call builds its own.
         requests: list[TransparentRequest] = [
-            ReadInputRegistersRequest(
-                base_register=0, register_count=60, slave_address=0x32
-            ),
-            ReadInputRegistersRequest(
-                base_register=180, register_count=60, slave_address=0x32
-            ),
+            cls(base, count) for cls, base, count in _REFRESH_REQUESTS
         ]
         if complete:
-            requests.append(
-                ReadHoldingRegistersRequest(
-                    base_register=0, register_count=60, slave_address=0x32
-                )
-            )
-            requests.append(
-                ReadHoldingRegistersRequest(
-                    base_register=60, register_count=60, slave_address=0x32
-                )
-            )
-            requests.append(
-                ReadHoldingRegistersRequest(
-                    base_register=120, register_count=60, slave_address=0x32
-                )
-            )
-            requests.append(
-                ReadInputRegistersRequest(
-                    base_register=120, register_count=60, slave_address=0x32
-                )
+            requests.extend(
+                cls(base, count) for cls, base, count in _COMPLETE_REFRESH_REQUESTS
             )
             number_batteries = max_batteries
-        for i in range(number_batteries):
-            requests.append(
-                ReadInputRegistersRequest(
-                    base_register=60, register_count=60, slave_address=0x32 + i
-                )
-            )
+        requests.extend(
+            ReadInputRegistersRequest(60, 60, 0x32 + i) for i in range(number_batteries)
+        )
         return requests
 
     def disable_charge_target(self) -> list[TransparentRequest]:
         """Removes SOC limit and target 100% charging."""
         return [
-            self.write_named_register('enable_charge_target', False),
+            self.write_named_register('enable_charge_target', 0),
             self.write_named_register('charge_target_soc', 100),
         ]
 
     def set_charge_target(self, target_soc: int) -> list[TransparentRequest]:
         """Sets inverter to stop charging when SOC reaches the desired level. Also referred to as "winter mode"."""
-        ret = self.set_enable_charge(True)
-        if target_soc == 100:
-            ret.extend(self.disable_charge_target())
-        else:
-            ret.append(
-                self.write_named_register('enable_charge_target', True),
-            )
-            ret.append(
-                self.write_named_register('charge_target_soc', target_soc),
-            )
-        return ret
+        # Always the same three registers. A target of 100% just means
+        # no target, so the limit gets switched off rather than on.
+        return [
+            self.write_named_register('enable_charge', 1),
+            self.write_named_register(
+                'enable_charge_target', 0 if target_soc == 100 else 1
+            ),
+            self.write_named_register('charge_target_soc', target_soc),
+        ]
 
     def set_inverter_reboot(self) -> list[TransparentRequest]:
         """Restart the inverter."""
@@ -220,16 +376,18 @@ class Commands(metaclass=DynamicDoc):
     # properly synchronised (eg send seconds first, unless it's close
     # to 60, in which case maybe send year/month/day, then wait for seconds
     # to wrap, then send hour/min/sec
+    # Passing the result through coalesce() sends all six in one request.
 
     def set_system_date_time(self, dt: datetime) -> list[TransparentRequest]:
         """Set the date & time of the inverter."""
+        # The fields of a datetime are necessarily in range, apart from
+        # the year, so skip the per-register lookup and validation.
+        if dt.year < 2000:
+            raise ValueError(f'{dt.year - 2000} out of range for system_time_year')
+        values = (dt.year - 2000, dt.month, dt.day, dt.hour, dt.minute, dt.second)
         return [
-            self.write_named_register("system_time_year", dt.year - 2000),
-            self.write_named_register("system_time_month", dt.month),
-            self.write_named_register("system_time_day", dt.day),
-            self.write_named_register("system_time_hour", dt.hour),
-            self.write_named_register("system_time_minute", dt.minute),
-            self.write_named_register("system_time_second", dt.second),
+            WriteHoldingRegisterRequest(idx, value)
+            for idx, value in zip(_SYSTEM_TIME_REGISTERS, values)
         ]
 
     def set_mode_dynamic(self) -> list[TransparentRequest]:
@@ -241,12 +399,11 @@ class Commands(metaclass=DynamicDoc):
         This mode is useful if you want to maximise self-consumption of renewable
         generation and minimise the amount of energy drawn from the grid.
         """
-        # r27=1 r110=4 r59=0
-        return (
-            self.set_discharge_mode_to_match_demand()
-            + self.set_battery_soc_reserve(4)
-            + self.set_enable_discharge(False)
-        )
+        return [
+            self.write_named_register('battery_power_mode', 1),  # r27=1
+            self.write_named_register('battery_soc_reserve', 4),  # r110=4
+            self.write_named_register('enable_discharge', 0),  # r59=0
+        ]
 
     def set_mode_storage(
         self,
@@ -269,21 +426,21 @@ class Commands(metaclass=DynamicDoc):
         export tariff (e.g. Agile export) and you want to target the peak times of
         day (e.g. 4pm-7pm) when it is most valuable to export energy.
         """
-        if discharge_for_export:
-            ret = self.set_discharge_mode_max_power()  # r27=0
-        else:
-            ret = self.set_discharge_mode_to_match_demand()  # r27=1
-        ret.extend(self.set_battery_soc_reserve(100))  # r110=100
-        ret.extend(self.set_enable_discharge(True))  # r59=1
-        ret.extend(self.set_discharge_slot_1(discharge_slot_1))  # r56=1600, r57=700
-        if discharge_slot_2:
-            ret.extend(self.set_discharge_slot_2(discharge_slot_2))  # r56=1600, r57=700
-        else:
-            ret.extend(self.reset_discharge_slot_2())
+        ret = [
+            self.write_named_register(
+                'battery_power_mode', 0 if discharge_for_export else 1
+            ),  # r27=0 (max power) or 1 (match demand)
+            self.write_named_register('battery_soc_reserve', 100),  # r110=100
+            self.write_named_register('enable_discharge', 1),  # r59=1
+        ]
+        ret += self._set_timeslot('discharge_slot_1', discharge_slot_1)  # r56=1600, r57=700
+        ret += self._set_timeslot('discharge_slot_2', discharge_slot_2 or None)
         return ret
 
-    # This is invoked when __doc__ is accessed.
+    # This is invoked when __doc__ is accessed. The result only depends
+    # on the register definitions, so it's worked out once and cached.
     @classmethod
+    @functools.cache
     def _gendoc(cls):
         """Construct a docstring from fixed prefix and register list."""
 
@@ -301,10 +458,5 @@ class Commands(metaclass=DynamicDoc):
         Some appear multiple times as aliases.\n\n"""
         )
 
-        for reg, defn in Inverter.REGISTER_LUT.items():
-            if defn.valid is not None:
-                doc += '* set_' + reg + "()\n"
-                if '_slot_' in reg and reg.endswith('_end'):
-                    doc += '* set_' + reg[:-4] + "()\n"
-                    doc += '* reset_' + reg[:-4] + "()\n"
-        return doc
+        # _METHOD_TABLE holds exactly the fabricated methods, in register order
+        return doc + "".join(f"* {name}()\n" for name in cls._METHOD_TABLE)
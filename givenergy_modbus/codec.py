@@ -31,6 +31,15 @@ class PayloadDecoder:
         handle = self._payload[self._pointer - 2 : self._pointer]
         return struct.unpack(self._byteorder + 'H', handle)[0]
 
+    def decode_16bit_uints(self, count: int) -> list[int]:
+        """Decodes a block of count 16-bit unsigned ints from the buffer."""
+        # a single unpack for the whole block, rather than one per value
+        values = struct.unpack_from(
+            f'{self._byteorder}{count}H', self._payload, self._pointer
+        )
+        self._pointer += 2 * count
+        return list(values)
+
     def decode_32bit_uint(self):
         """Decodes a 32-bit unsigned int from the buffer."""
         self._pointer += 4
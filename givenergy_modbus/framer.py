@@ -69,16 +69,21 @@ class Framer(ABC):
         * `0x03` - read holding registers
         * `0x04` - read input registers
         * `0x06` - write single holding register
-        * `0x10` - write multiple holding registers (not implemented by this library)
+        * `0x10` - write multiple holding registers
         * `0x16` - read battery input registers
     * ``data`` (*n* bytes) depends on the function invoked
     * ``crc`` (2 bytes) CRC for a request is calculated using the function id, base register and
       step count, but it is unclear how a response CRC is calculated or should be verified.
     """
 
-    _buffer: bytes = b""
+    # frames are consumed from the front of this in place, rather than
+    # copying the remainder of the buffer into a new bytes object each time
+    _buffer: bytearray
     pdu_class: "Type[BasePDU]"
 
+    def __init__(self):
+        self._buffer = bytearray()
+
     def decode(self, data: bytes) -> Iterator[Union[BasePDU, ExceptionBase]]:
         """Receive incoming network data and attempt to decode frames into messages.
 
@@ -113,14 +118,17 @@ class Framer(ABC):
                     frame_start_offset,
                     self._buffer[:frame_start_offset].hex(),
                 )
-                self._buffer = self._buffer[frame_start_offset:]
+                del self._buffer[:frame_start_offset]
                 continue
 
-            _logger.debug(
-                "Found next frame: 0x%s..., buffer_len=%d",
-                self._buffer[:8].hex(),
-                len(self._buffer),
-            )
+            # runs for every frame, so avoid slicing and hexing the buffer
+            # just to throw the result away when debug logging is off
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    "Found next frame: 0x%s..., buffer_len=%d",
+                    self._buffer[:8].hex(),
+                    len(self._buffer),
+                )
 
             # check that the current frame isn't invalid / weirdly truncated
             next_frame_start_offset = self._buffer.find(HEADER_START_MARKER, 1)
@@ -132,7 +140,7 @@ class Framer(ABC):
                     len(self._buffer),
                     self._buffer.hex(),
                 )
-                self._buffer = self._buffer[next_frame_start_offset:]
+                del self._buffer[:next_frame_start_offset]
                 continue
 
             # sanity check the rest of the MBAP header
@@ -149,7 +157,7 @@ class Framer(ABC):
                     u_id,
                     f_id,
                 )
-                self._buffer = self._buffer[4:]
+                del self._buffer[:4]
                 continue
 
             # Calculate how many bytes is needed to read the current frame completely and await more data if necessary
@@ -163,8 +171,8 @@ class Framer(ABC):
                 break
 
             # Extract the frame and try to decode it
-            frame = self._buffer[:frame_len]
-            self._buffer = self._buffer[frame_len:]
+            frame = bytes(self._buffer[:frame_len])
+            del self._buffer[:frame_len]
             try:
                 yield self.pdu_class.decode_bytes(frame)
             except (InvalidPduState, InvalidFrame) as e:
@@ -175,6 +183,7 @@ class ClientFramer(Framer):
     """Framer implementation for client-side use."""
 
     def __init__(self):
+        super().__init__()
         self.pdu_class = ClientIncomingMessage
 
 
@@ -182,4 +191,5 @@ class ServerFramer(Framer):
     """Framer implementation for server-side use."""
 
     def __init__(self):
+        super().__init__()
         self.pdu_class = ServerIncomingMessage
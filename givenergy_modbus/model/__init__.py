@@ -16,6 +16,7 @@ the system.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from datetime import time
 from enum import IntEnum
@@ -28,15 +29,27 @@ class DefaultUnknownIntEnum(IntEnum):
         return cls.UNKNOWN  # type: ignore[attr-defined] # must be defined in subclasses because of Enum limits
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeSlot:
-    """Dataclass to represent a time slot, with a start and end time."""
+    """Dataclass to represent a time slot, with a start and end time.
+
+    TimeSlots are immutable, and can also report the start and end times in
+    the GivEnergy (hours * 100 + minute) integer format used by the registers.
+    """
 
-    # TODO perhaps just store as GE integers - (h * 100 + m) and
-    # convert to time on demand (making start and end properties ?)
     start: time
     end: time
 
+    @property
+    def start_hhmm(self) -> int:
+        """Start time in register format, eg 16:30 -> 1630."""
+        return 100 * self.start.hour + self.start.minute
+
+    @property
+    def end_hhmm(self) -> int:
+        """End time in register format, eg 07:00 -> 700."""
+        return 100 * self.end.hour + self.end.minute
+
     @classmethod
     def from_components(
         cls, start_hour: int, start_minute: int, end_hour: int, end_minute: int
@@ -44,17 +57,24 @@ class TimeSlot:
         """Shorthand for the individual datetime.time constructors."""
         return cls(time(start_hour, start_minute), time(end_hour, end_minute))
 
+    # Every refresh decodes the same handful of slots (often 0000-0000)
+    # again, and TimeSlots are immutable, so the results can be shared.
     @classmethod
+    @functools.lru_cache(maxsize=256)
     def from_repr(cls, start: int | str, end: int | str):
         """Converts from human-readable/ASCII representation: '0034' -> 00:34."""
+        # ints (as read from the registers) are split arithmetically,
+        # without a round trip through a formatted string
         if isinstance(start, int):
-            start = f"{start:04d}"
-        start_hour = int(start[:-2])
-        start_minute = int(start[-2:])
+            start_hour, start_minute = divmod(start, 100)
+        else:
+            start_hour = int(start[:-2])
+            start_minute = int(start[-2:])
         if isinstance(end, int):
-            end = f"{end:04d}"
-        end_hour = int(end[:-2])
-        end_minute = int(end[-2:])
+            end_hour, end_minute = divmod(end, 100)
+        else:
+            end_hour = int(end[:-2])
+            end_minute = int(end[-2:])
         return cls(time(start_hour, start_minute), time(end_hour, end_minute))
 
     def __contains__(self, t: time|int) -> bool:
@@ -63,19 +83,24 @@ class TimeSlot:
         Parameter is either a time, or an integer in (hours * 100 + minute) format.
         """
 
-        if self.start == self.end:
-            return False
-
         if isinstance(t, int):
-            t = time(t // 100, t % 100)
-        elif not isinstance(t, time):
+            hour, minute = divmod(t, 100)
+            # the same checks, and messages, as datetime.time(hour, minute)
+            if not 0 <= hour <= 23:
+                raise ValueError("hour must be in 0..23")
+            if not 0 <= minute <= 59:
+                raise ValueError("minute must be in 0..59")
+            minutes = 60 * hour + minute
+        elif isinstance(t, time):
+            minutes = 60 * t.hour + t.minute
+        else:
             # TODO throw an exception?  Return NotImplemented?
             return False
 
-        # now "inside" depends on whether the timeslot
-        # spans midnight
-
-        if self.start < self.end:
-            return self.start <= t < self.end
-        else:
-            return not (self.end <= t < self.start)
+        # Measuring everything in minutes from the start of the slot, modulo
+        # one day, takes care of slots that span midnight without a special
+        # case. An empty slot (start == end) has a duration of 0, so contains
+        # nothing.
+        start = 60 * self.start.hour + self.start.minute
+        duration = (60 * self.end.hour + self.end.minute - start) % 1440
+        return (minutes - start) % 1440 < duration
@@ -28,6 +28,8 @@ class Battery(RegisterGetter, metaclass=DynamicDoc):
     # The metaclass turns accesses to __doc__ into calls to
     # _gendoc()  (which we inherit from RegisterGetter)
 
+    __slots__ = ()
+
     _DOC = """Battery presents all battery attributes as python types."""
 
     REGISTER_LUT = {
@@ -6,6 +6,7 @@ supporting enumerations.
 """
 
 from enum import IntEnum, StrEnum
+import functools
 import math
 from typing import Optional
 from .register import (
@@ -187,6 +188,8 @@ class Inverter(RegisterGetter, metaclass=DynamicDoc):
     # The metaclass turns accesses to __doc__ into calls to
     # _gendoc()  (which we inherit from RegisterGetter)
 
+    __slots__ = ()
+
     _DOC = """Interprets the low-level registers in the inverter as named attributes."""
 
     # TODO: add register aliases and valid=(min,max) for writable registers
@@ -503,25 +506,35 @@ class Inverter(RegisterGetter, metaclass=DynamicDoc):
     #     """Computes the discharge slot 2."""
     #     return e_pv1_day + e_pv2_day
 
+    # The register definitions are fixed, so the name -> (index, valid range)
+    # part of the lookup only needs doing once per name. Only successful
+    # lookups are cached - errors are raised afresh each time.
     @classmethod
-    def lookup_writable_register(cls, name: str, value: Optional[int] = None):
-        """
-        If the named register is writable and value is in range, return index.
-        """
-
+    @functools.cache
+    def _writable_register(cls, name: str) -> tuple[int, tuple[int, int]]:
+        """Return the index and valid range of a writable register."""
         regdef = cls.REGISTER_LUT[name]
         if regdef.valid is None:
             raise ValueError(f'{name} is not writable')
         if len(regdef.registers) > 1:
             raise NotImplementedError('wide register')
+        return regdef.registers[0]._idx, regdef.valid  # pylint: disable=protected-access
+
+    @classmethod
+    def lookup_writable_register(cls, name: str, value: Optional[int] = None):
+        """
+        If the named register is writable and value is in range, return index.
+        """
+
+        idx, (low, high) = cls._writable_register(name)
 
         if value is not None:
-            if value < regdef.valid[0] or value > regdef.valid[1]:
+            if value < low or value > high:
                 raise ValueError(f'{value} out of range for {name}')
 
-            if regdef.valid[1] == 2359:
+            if high == 2359:
                 # As a special case, assume this register is a time
                 if value % 100 >= 60:
                     raise ValueError(f'{value} is not a valid time')
 
-        return regdef.registers[0]._idx  # pylint: disable=protected-access
+        return idx
@@ -1,8 +1,9 @@
 import logging
+from typing import Any, Callable, ClassVar
 
 from .battery import Battery
 from .inverter import Inverter
-from .register import HR
+from .register import HR, IR, RegisterGetter
 from .register_cache import (
     RegisterCache,
 )
@@ -11,64 +12,125 @@ from ..pdu import (
     NullResponse,
     ReadHoldingRegistersResponse,
     ReadInputRegistersResponse,
+    ReadRegistersResponse,
     TransparentResponse,
     WriteHoldingRegisterResponse,
+    WriteHoldingRegistersRequest,
 )
 
 _logger = logging.getLogger(__name__)
 
+# first of the battery serial number registers, checked for each
+# possible battery by detect_batteries()
+_BATTERY_SERIAL_NUMBER = IR(110)
+
+# slave addresses used by the cloud and the mobile app
+_REMAPPED_SLAVE_ADDRESSES = frozenset((0x11, 0x00))
+
 
 class Plant:
     """Representation of a complete GivEnergy plant."""
 
-    register_caches: dict[int, RegisterCache] = {}
+    # update() touches several of these on every PDU; slots keep that
+    # cheap. Slots can't have class-level defaults, so __init__ sets them.
+    __slots__ = (
+        "register_caches",
+        "inverter_serial_number",
+        "data_adapter_serial_number",
+        "number_batteries",
+        "_views",
+    )
+
+    register_caches: dict[int, RegisterCache]
     inverter_serial_number: str
-    data_adapter_serial_number: str = ""
-    number_batteries: int = 0
+    data_adapter_serial_number: str
+    number_batteries: int
 
     def __init__(self, inverter_serial_number: str = "", register_caches=None) -> None:
         self.inverter_serial_number = inverter_serial_number
+        self.data_adapter_serial_number = ""
+        self.number_batteries = 0
         if not register_caches:
             register_caches = {0x32: RegisterCache()}
         self.register_caches = register_caches
+        # (class, slave address) -> Inverter/Battery view, see _view()
+        self._views: dict[tuple[type, int], RegisterGetter] = {}
 
     def update(self, pdu: ClientIncomingMessage):
         """Update the Plant state from a PDU message."""
+        # Discarded PDUs (heartbeats, null responses) are common, so these
+        # exits leave pdu untouched unless debug logging wants to show it.
         if not isinstance(pdu, TransparentResponse):
-            _logger.debug(f"Ignoring non-Transparent response {pdu}")
+            _logger.debug("Ignoring non-Transparent response %s", pdu)
             return
         if isinstance(pdu, NullResponse):
-            _logger.debug(f"Ignoring Null response {pdu}")
+            _logger.debug("Ignoring Null response %s", pdu)
             return
         if pdu.error:
-            _logger.debug(f"Ignoring error response {pdu}")
+            _logger.debug("Ignoring error response %s", pdu)
             return
-        _logger.debug(f"Handling {pdu}")
+        _logger.debug("Handling %s", pdu)
+
+        cache = self._cache_for(pdu.slave_address)
+
+        # These don't change in the lifetime of a plant, so only the first
+        # response that carries them needs recording.
+        if not self.inverter_serial_number:
+            self.inverter_serial_number = pdu.inverter_serial_number
+        if not self.data_adapter_serial_number:
+            self.data_adapter_serial_number = pdu.data_adapter_serial_number
+
+        handler = self._UPDATE_HANDLERS.get(type(pdu))
+        if handler is not None:
+            handler(cache, pdu)
+
+    def apply_write(self, request: WriteHoldingRegistersRequest):
+        """Record the values of a write-multiple request the inverter has acknowledged.
 
-        if pdu.slave_address in (0x11, 0x00):
+        Unlike a single register write, the ack only echoes the base register
+        and count, so the values have to come from the request itself.
+        """
+        cache = self._cache_for(request.slave_address)
+        cache.update(
+            (HR(r), v)
+            for r, v in enumerate(request.register_values, start=request.base_register)
+        )
+
+    def _cache_for(self, slave_address: int) -> RegisterCache:
+        """Find, or create, the register cache for a slave address."""
+        if slave_address in _REMAPPED_SLAVE_ADDRESSES:
             # rewrite cloud and mobile app responses to "normal" inverter address
             slave_address = 0x32
-        else:
-            slave_address = pdu.slave_address
 
-        if slave_address not in self.register_caches:
+        cache = self.register_caches.get(slave_address)
+        if cache is None:
             _logger.debug(
-                f"First time encountering slave address 0x{slave_address:02x}"
+                "First time encountering slave address 0x%02x", slave_address
             )
-            self.register_caches[slave_address] = RegisterCache()
+            cache = self.register_caches[slave_address] = RegisterCache()
+        return cache
 
-        self.inverter_serial_number = pdu.inverter_serial_number
-        self.data_adapter_serial_number = pdu.data_adapter_serial_number
+    # Handlers for the responses that carry register values, dispatched
+    # on the exact type of the PDU via _UPDATE_HANDLERS.
 
-        if isinstance(pdu, ReadHoldingRegistersResponse):
-            self.register_caches[slave_address].update(pdu.enumerate())
-        elif isinstance(pdu, ReadInputRegistersResponse):
-            self.register_caches[slave_address].update(pdu.enumerate())
-        elif isinstance(pdu, WriteHoldingRegisterResponse):
-            if pdu.register == 0:
-                _logger.warning(f"Ignoring, likely corrupt: {pdu}")
-            else:
-                self.register_caches[slave_address][HR(pdu.register)] = pdu.value
+    @staticmethod
+    def _update_read_registers(cache: RegisterCache, pdu: ReadRegistersResponse):
+        cache.update(pdu.enumerate())
+
+    @staticmethod
+    def _update_written_register(
+        cache: RegisterCache, pdu: WriteHoldingRegisterResponse
+    ):
+        if pdu.register == 0:
+            _logger.warning("Ignoring, likely corrupt: %s", pdu)
+        else:
+            cache[HR(pdu.register)] = pdu.value
+
+    _UPDATE_HANDLERS: ClassVar[dict[type, Callable]] = {
+        ReadHoldingRegistersResponse: _update_read_registers,
+        ReadInputRegistersResponse: _update_read_registers,
+        WriteHoldingRegisterResponse: _update_written_register,
+    }
 
     def detect_batteries(self) -> None:
         """Determine the number of batteries based on whether the register data is valid.
@@ -78,22 +140,33 @@ class Plant:
         """
         i = 0
         for i in range(6):
-            try:
-                assert Battery(self.register_caches[i + 0x32]).is_valid()
-            except (KeyError, AssertionError):
+            cache = self.register_caches.get(i + 0x32)
+            # Only decode the battery once its serial number has been read
+            if (
+                cache is None
+                or _BATTERY_SERIAL_NUMBER not in cache
+                or not self._view(Battery, i + 0x32).is_valid()
+            ):
                 break
         _logger.debug("Updating connected battery count to %d", i)
         self.number_batteries = i
 
+    # The models decode registers on demand from the live cache, so one
+    # instance per cache stays current, and can be handed out repeatedly.
+    # A new one is only needed if the cache itself gets replaced.
+    def _view(self, cls: type, slave_address: int) -> Any:
+        cache = self.register_caches[slave_address]
+        view = self._views.get((cls, slave_address))
+        if view is None or view.cache is not cache:
+            view = self._views[(cls, slave_address)] = cls(cache)
+        return view
+
     @property
     def inverter(self) -> Inverter:
         """Return Inverter model for the Plant."""
-        return Inverter(self.register_caches[0x32])
+        return self._view(Inverter, 0x32)
 
     @property
     def batteries(self) -> list[Battery]:
         """Return Battery models for the Plant."""
-        return [
-            Battery(self.register_caches[i + 0x32])
-            for i in range(self.number_batteries)
-        ]
+        return [self._view(Battery, i + 0x32) for i in range(self.number_batteries)]
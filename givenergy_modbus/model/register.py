@@ -4,6 +4,9 @@ Helper classes for the Plant, Inverter and Battery.
 Applications shouldn't need to worry about these.
 """
 
+import functools
+import operator
+import struct
 from dataclasses import dataclass
 from datetime import datetime
 from json import JSONEncoder
@@ -17,6 +20,21 @@ from ..exceptions import (
 from . import TimeSlot
 
 
+# Inverter max power by device type code
+_DTC_TO_POWER: dict[str, int] = {
+    "2001": 5000,
+    "2002": 4600,
+    "2003": 3600,
+    "3001": 3000,
+    "3002": 3600,
+    "4001": 6000,
+    "4002": 8000,
+    "4003": 10000,
+    "4004": 11000,
+    "8001": 6000,
+}
+
+
 class Converter:
     """Type of data register represents. Encoding is always big-endian."""
 
@@ -30,9 +48,8 @@ class Converter:
     def int16(val: int) -> int:
         """Interpret as a 16-bit integer register value."""
         if val is not None:
-            if val & (1 << (16 - 1)):
-                val -= 1 << 16
-            return val
+            # subtract 2**16 when the sign bit is set
+            return val - ((val & 0x8000) << 1)
 
     @staticmethod
     def duint8(val: int, *idx: int) -> int:
@@ -64,8 +81,9 @@ class Converter:
     def string(*vals: int) -> Optional[str]:
         """Represent one or more registers as a concatenated string."""
         if vals is not None and None not in vals:
+            # struct keeps its own cache of compiled formats
             return (
-                b"".join(v.to_bytes(2, byteorder="big") for v in vals)
+                struct.pack(">%dH" % len(vals), *vals)
                 .decode(encoding="latin1")
                 .replace("\x00", "")
                 .upper()
@@ -79,7 +97,10 @@ class Converter:
             return f"{val:{fmt}}"
         return None
 
+    # Both versions only change on a firmware update, so every refresh
+    # would otherwise format the same string again.
     @staticmethod
+    @functools.lru_cache(maxsize=16)
     def firmware_version(dsp_version: int, arm_version: int) -> Optional[str]:
         """Represent ARM & DSP firmware versions in the same format as the dashboard."""
         if dsp_version is not None and arm_version is not None:
@@ -88,19 +109,7 @@ class Converter:
     @staticmethod
     def inverter_max_power(device_type_code: str) -> Optional[int]:
         """Determine max inverter power from device_type_code."""
-        dtc_to_power = {
-            "2001": 5000,
-            "2002": 4600,
-            "2003": 3600,
-            "3001": 3000,
-            "3002": 3600,
-            "4001": 6000,
-            "4002": 8000,
-            "4003": 10000,
-            "4004": 11000,
-            "8001": 6000,
-        }
-        return dtc_to_power.get(device_type_code)
+        return _DTC_TO_POWER.get(device_type_code)
 
     @staticmethod
     def hex(val: int, width: int = 4) -> str:
@@ -138,6 +147,8 @@ class Converter:
 class RegisterDefinition:
     """Specifies how to convert raw register values into their actual representation."""
 
+    __slots__ = ("pre_conv", "post_conv", "registers", "valid")
+
     pre_conv: Union[Callable, tuple, None]
     post_conv: Union[Callable, tuple[Callable, Any], None]
     registers: tuple["Register"]
@@ -154,6 +165,106 @@ class RegisterDefinition:
     def __hash__(self):
         return hash(self.registers)
 
+    def compile(self) -> Callable[[Any], Any]:
+        """Return a function that decodes this definition from a register cache.
+
+        The conversion recipe is unpacked once, up front, rather than on
+        every lookup. The returned function yields None if any of the
+        registers is missing from the cache.
+        """
+        registers = self.registers
+        pre, pre_args = _split_conv(self.pre_conv)
+        post, post_args = _split_conv(self.post_conv)
+
+        if len(registers) == 1:
+            (reg,) = registers
+
+            # Cache values are already plain ints, so a bare uint16 needs
+            # no conversion at all.
+            if pre is Converter.uint16 and post is None:
+
+                def decode_raw(cache):
+                    return cache.get(reg)
+
+                return decode_raw
+
+            # Pick out the wanted byte directly, without building the pair.
+            if pre is Converter.duint8:
+                pre, pre_args = _BYTE_OF_UINT16[pre_args[0]], ()
+
+            # By far the most common shape: one register, a plain
+            # pre-conversion and an optional plain post-conversion.
+            if pre is not None and not pre_args:
+                if post is None:
+
+                    def decode_one(cache):
+                        val = cache.get(reg)
+                        return None if val is None else pre(val)
+
+                    return decode_one
+
+                if not post_args:
+
+                    def decode_one_post(cache):
+                        val = cache.get(reg)
+                        return None if val is None else post(pre(val))
+
+                    return decode_one_post
+
+        # Register pairs (32-bit values, time slots) are the next most
+        # common, and can give up as soon as either half is missing.
+        if len(registers) == 2 and pre is not None and not pre_args:
+            reg_hi, reg_lo = registers
+
+            if pre is Converter.uint32:
+
+                def decode_uint32(cache):
+                    hi = cache.get(reg_hi)
+                    if hi is None:
+                        return None
+                    lo = cache.get(reg_lo)
+                    if lo is None:
+                        return None
+                    val = (hi << 16) + lo
+                    return val if post is None else post(val, *post_args)
+
+                return decode_uint32
+
+            def decode_two(cache):
+                hi = cache.get(reg_hi)
+                if hi is None:
+                    return None
+                lo = cache.get(reg_lo)
+                if lo is None:
+                    return None
+                val = pre(hi, lo)
+                return val if post is None else post(val, *post_args)
+
+            return decode_two
+
+        def decode(cache):
+            regs = [cache.get(r) for r in registers]
+            if None in regs:
+                return None
+            val = regs if pre is None else pre(*regs, *pre_args)
+            return val if post is None else post(val, *post_args)
+
+        return decode
+
+
+# Stand-ins for Converter.duint8(val, 0) and Converter.duint8(val, 1)
+_BYTE_OF_UINT16: tuple[Callable[[int], int], ...] = (
+    lambda val: val >> 8,
+    lambda val: val & 0xFF,
+)
+
+
+def _split_conv(conv) -> tuple[Optional[Callable], tuple]:
+    """Separate a (func, *args) conversion into func and args."""
+    if isinstance(conv, tuple):
+        return conv[0], conv[1:]
+    return conv, ()
+
 
 # This is used as the metaclass for Inverter and Battery,
 # in order to dynamically generate a docstring from the
@@ -182,10 +293,21 @@ class RegisterGetter:
     code for constructing python attrbitutes from the register definitions.
     """
 
+    # The only instance state is the cache; attributes come from the LUT.
+    __slots__ = ("cache",)
+
     # defined by subclass
     REGISTER_LUT: ClassVar[dict[str, RegisterDefinition]]
     _DOC: ClassVar[str]
 
+    # REGISTER_LUT compiled into decoding functions, built once per subclass
+    _DECODERS: ClassVar[dict[str, Callable[[Any], Any]]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "REGISTER_LUT" in cls.__dict__:
+            cls._DECODERS = {k: r.compile() for k, r in cls.REGISTER_LUT.items()}
+
     # TODO: cache is actually a RegisterCache, but importing that gives a circular dependency
     def __init__(self, cache: Any):
         self.cache = cache  # RegisterCache
@@ -198,30 +320,10 @@ class RegisterGetter:
     # or you can just use inverter.get('name')
     def get(self, key: str) -> Any:
         """Return a named register's value, after pre- and post-conversion."""
-        r = self.REGISTER_LUT[key]
-
-        regs = [self.cache.get(r) for r in r.registers]
-
-        if None in regs:
-            return None
-
         try:
-            if r.pre_conv:
-                if isinstance(r.pre_conv, tuple):
-                    args = regs + list(r.pre_conv[1:])
-                    val = r.pre_conv[0](*args)
-                else:
-                    val = r.pre_conv(*regs)
-            else:
-                val = regs
-
-            if r.post_conv:
-                if isinstance(r.post_conv, tuple):
-                    return r.post_conv[0](val, *r.post_conv[1:])
-                else:
-                    return r.post_conv(val)
-            return val
+            return self._DECODERS[key](self.cache)
         except ValueError as err:
+            regs = [self.cache.get(r) for r in self.REGISTER_LUT[key].registers]
             raise ConversionError(key, regs, str(err)) from err
 
     def getall(self) -> Iterator[tuple[str, Any]]:
@@ -239,7 +341,9 @@ class RegisterGetter:
     # This gets invoked during pydoc or similar by a bit of python voodoo.
     # Inverter and Battery use util.DynamicDoc as a metaclass, and
     # that defines __doc__ as a property which ends up in here.
+    # REGISTER_LUT doesn't change, so the result is cached per class.
     @classmethod
+    @functools.cache
     def _gendoc(cls):
         """Construct a docstring from fixed prefix and register list."""
 
@@ -256,9 +360,7 @@ class RegisterGetter:
         Some appear multiple times as aliases.\n\n"""
         )
 
-        for reg in cls.REGISTER_LUT.keys():
-            doc += '* ' + reg + "\n"
-        return doc
+        return doc + "".join(f"* {reg}\n" for reg in cls.REGISTER_LUT)
 
 
 class RegisterEncoder(JSONEncoder):
@@ -271,7 +373,7 @@ class RegisterEncoder(JSONEncoder):
     def default(self, o: Any) -> str:
         """Custom JSON encoder to treat RegisterCaches specially."""
         if isinstance(o, Register):
-            return f"{o._type}_{o._idx}"
+            return o._name
         else:
             return super().default(o)
 
@@ -283,40 +385,53 @@ class RegisterEncoder(JSONEncoder):
 class Register:
     """Register base class."""
 
-    __slots__ = "_idx"
+    __slots__ = ("_idx", "_name")
     TYPE_HOLDING = "HR"
     TYPE_INPUT = "IR"
 
     _type: ClassVar[str]
+    _pool: ClassVar[dict[int, "Register"]]
     _idx: int
-
-    def __init__(self, idx):
-        self._idx = idx
+    _name: str
+
+    # Instances are interned, one per (class, idx). The keys in a
+    # RegisterCache are then the very objects the REGISTER_LUT definitions
+    # hold, so dict lookups match on identity without calling __eq__.
+    def __new__(cls, idx):
+        # Normalise first, so that whatever is used first (an IntEnum
+        # member, a bool, ...) doesn't become the pooled instance's _idx.
+        idx = operator.index(idx)
+        try:
+            return cls._pool[idx]
+        except KeyError:
+            reg = cls._pool[idx] = super().__new__(cls)
+            reg._idx = idx
+            # rendered once, for str() and RegisterEncoder
+            reg._name = "%s_%d" % (cls._type, idx)
+            return reg
 
     def __str__(self):
-        return "%s_%d" % (self._type, int(self._idx))
+        return self._name
 
     __repr__ = __str__
 
-    # this assumes HR and IR are not subclassed.
-    def __eq__(self, other):
-        return type(self) is type(other) and self._idx == other._idx
+    # Interning means equal registers are the same object, so the default
+    # identity-based __eq__ and __hash__ apply, and dict operations on
+    # Register keys never call back into python. Copies and unpickling
+    # must go back through __new__ to preserve that.
+    def __reduce__(self):
+        return type(self), (self._idx,)
 
     def __int__(self):
         return self._idx
 
 
-# Choose simple hash functions that do not overlap
-
-
 class HR(Register):
     """Holding Register."""
 
     __slots__ = ()
     _type = Register.TYPE_HOLDING
-
-    def __hash__(self):
-        return -10 - self._idx
+    _pool = {}
 
 
 class IR(Register):
@@ -324,6 +439,4 @@ class IR(Register):
 
     __slots__ = ()
     _type = Register.TYPE_INPUT
-
-    def __hash__(self):
-        return 10 + self._idx
+    _pool = {}
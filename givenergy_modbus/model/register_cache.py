@@ -1,4 +1,5 @@
 import json
+import re
 from typing import DefaultDict, Optional
 
 from .register import (
@@ -18,29 +19,31 @@ class RegisterCache(DefaultDict[Register, int]):
 
     def json(self) -> str:
         """Return JSON representation of the register cache, to mirror `from_json()`."""  # noqa: D402,D202,E501
-        return json.dumps(self)
+        # json can't take Register keys, so key on the "HR:1" form from_json() reads
+        return json.dumps({f"{r._type}:{r._idx}": v for r, v in self.items()})
 
     @classmethod
     def from_json(cls, data: str) -> "RegisterCache":
         """Instantiate a RegisterCache from its JSON form."""
-
-        def register_object_hook(object_dict: dict[str, int]) -> dict[Register, int]:
-            """Rewrite the parsed object to have Register instances as keys instead of their (string) repr."""
-            lookup = {"HR": HR, "IR": IR}
-            ret = {}
-            for k, v in object_dict.items():
-                if k.find("(") > 0:
-                    reg, idx = k.split("(", maxsplit=1)
-                    idx = idx[:-1]
-                elif k.find(":") > 0:
-                    reg, idx = k.split(":", maxsplit=1)
-                else:
-                    raise ValueError(f"{k} is not a valid Register type")
-                try:
-                    ret[lookup[reg](int(idx))] = v
-                except ValueError:
-                    # unknown register, discard silently
-                    continue
-            return ret
-
-        return cls(registers=(json.loads(data, object_hook=register_object_hook)))
+        return cls(registers=(json.loads(data, object_hook=_register_object_hook)))
+
+
+# Register keys are serialised as either "HR(1)" or "HR:1"
+_REGISTER_KEY = re.compile(r"(HR|IR)(?:\((.*)\)|:(.*))")
+_REGISTER_TYPES = {"HR": HR, "IR": IR}
+
+
+def _register_object_hook(object_dict: dict[str, int]) -> dict[Register, int]:
+    """Rewrite the parsed object to have Register instances as keys instead of their (string) repr."""
+    ret = {}
+    for k, v in object_dict.items():
+        m = _REGISTER_KEY.fullmatch(k)
+        if m is None:
+            raise ValueError(f"{k} is not a valid Register type")
+        reg, idx, alt_idx = m.groups()
+        try:
+            ret[_REGISTER_TYPES[reg](int(alt_idx if idx is None else idx))] = v
+        except ValueError:
+            # unknown register, discard silently
+            continue
+    return ret
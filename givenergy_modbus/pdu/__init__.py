@@ -37,6 +37,9 @@ from .write_registers import (
     WriteHoldingRegister,
     WriteHoldingRegisterRequest,
     WriteHoldingRegisterResponse,
+    WriteHoldingRegisters,
+    WriteHoldingRegistersRequest,
+    WriteHoldingRegistersResponse,
 )
 
 __all__ = [
@@ -67,4 +70,7 @@ __all__ = [
     "WriteHoldingRegister",
     "WriteHoldingRegisterRequest",
     "WriteHoldingRegisterResponse",
+    "WriteHoldingRegisters",
+    "WriteHoldingRegistersRequest",
+    "WriteHoldingRegistersResponse",
 ]
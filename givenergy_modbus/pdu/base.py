@@ -1,3 +1,4 @@
+import functools
 import logging
 import struct
 from abc import ABC
@@ -100,9 +101,12 @@ class BasePDU(ABC):
 
         if not decoder.decoding_complete:
             _logger.error(
-                f"Decoder did not fully consume frame for {pdu}: decoded {decoder.decoded_bytes}b but "
-                f"packet header specified length={decoder.payload_size}. "
-                f"Remaining payload: [{decoder.remaining_payload.hex()}]"
+                "Decoder did not fully consume frame for %s: decoded %db but "
+                "packet header specified length=%d. Remaining payload: [%s]",
+                pdu,
+                decoder.decoded_bytes,
+                decoder.payload_size,
+                decoder.remaining_payload.hex(),
             )
         return pdu
 
@@ -153,23 +157,27 @@ class BasePDU(ABC):
 class ClientIncomingMessage(BasePDU, ABC):
     """Root of the hierarchy for PDUs clients are expected to receive and handle."""
 
+    # Built on first use, since the imports would be circular at module level
     @classmethod
-    def lookup_main_function_decoder(
-        cls, function_code: int
-    ) -> type["ClientIncomingMessage"]:
+    @functools.cache
+    def _main_function_decoders(cls) -> dict[int, type["ClientIncomingMessage"]]:
         from .import (
             HeartbeatRequest,
             TransparentResponse,
         )
 
-        if function_code == 1:
-            return HeartbeatRequest
-        elif function_code == 2:
-            return TransparentResponse
-        else:
+        return {1: HeartbeatRequest, 2: TransparentResponse}
+
+    @classmethod
+    def lookup_main_function_decoder(
+        cls, function_code: int
+    ) -> type["ClientIncomingMessage"]:
+        decoder_class = cls._main_function_decoders().get(function_code)
+        if decoder_class is None:
             raise NotImplementedError(
                 f"ClientIncomingMessage main function #{function_code} decoder"
             )
+        return decoder_class
 
     def expected_response(self) -> Optional["ClientOutgoingMessage"]:
         """Create a template of a correctly shaped Response expected for this Request."""
@@ -179,23 +187,27 @@ class ClientIncomingMessage(BasePDU, ABC):
 class ClientOutgoingMessage(BasePDU, ABC):
     """Root of the hierarchy for PDUs clients are expected to send to servers."""
 
+    # Built on first use, since the imports would be circular at module level
     @classmethod
-    def lookup_main_function_decoder(
-        cls, function_code: int
-    ) -> type["ClientOutgoingMessage"]:
+    @functools.cache
+    def _main_function_decoders(cls) -> dict[int, type["ClientOutgoingMessage"]]:
         from .import (
             HeartbeatResponse,
             TransparentRequest,
         )
 
-        if function_code == 1:
-            return HeartbeatResponse
-        elif function_code == 2:
-            return TransparentRequest
-        else:
+        return {1: HeartbeatResponse, 2: TransparentRequest}
+
+    @classmethod
+    def lookup_main_function_decoder(
+        cls, function_code: int
+    ) -> type["ClientOutgoingMessage"]:
+        decoder_class = cls._main_function_decoders().get(function_code)
+        if decoder_class is None:
             raise NotImplementedError(
                 f"ClientOutgoingMessage main function #{function_code} decoder"
             )
+        return decoder_class
 
 
 ServerIncomingMessage = ClientOutgoingMessage
@@ -71,7 +71,7 @@ class HeartbeatResponse(HeartbeatMessage, ClientOutgoingMessage, ABC):
         decoder = PayloadDecoder(data)
         self.data_adapter_serial_number = decoder.decode_string(10)
         self.data_adapter_type = decoder.decode_8bit_uint()
-        _logger.debug(f"Successfully decoded {len(data)} bytes")
+        _logger.debug("Successfully decoded %d bytes", len(data))
 
     def expected_response(self) -> None:
         """No replies expected for HeartbeatResponse."""
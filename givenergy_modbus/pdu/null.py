@@ -33,9 +33,12 @@ class NullResponse(TransparentResponse):
     ) -> "NullResponse":
         if decoder.remaining_bytes != 126:
             _logger.warning(
-                f"remaining bytes: {decoder.remaining_bytes}b 0x{decoder.remaining_payload.hex()} attrs: {attrs}"
+                "remaining bytes: %db 0x%s attrs: %s",
+                decoder.remaining_bytes,
+                decoder.remaining_payload.hex(),
+                attrs,
             )
-        attrs["nulls"] = [decoder.decode_16bit_uint() for _ in range(62)]
+        attrs["nulls"] = decoder.decode_16bit_uints(62)
         attrs["check"] = decoder.decode_16bit_uint()
         return cls(**attrs)
 
@@ -47,11 +50,14 @@ class NullResponse(TransparentResponse):
         if self.inverter_serial_number != "\x00" * 10:
             hex_str = self.inverter_serial_number.encode("latin1").hex()
             _logger.warning(
-                f"Unexpected non-null inverter serial number: {self.inverter_serial_number}/0x{hex_str}"
+                "Unexpected non-null inverter serial number: %s/0x%s",
+                self.inverter_serial_number,
+                hex_str,
             )
         if any(self.nulls):
             _logger.warning(
-                f'Unexpected non-null "register" values: {dict(filter(lambda v: v[1] != 0, enumerate(self.nulls)))}'
+                'Unexpected non-null "register" values: %s',
+                {i: v for i, v in enumerate(self.nulls) if v},
             )
 
     def _extra_shape_hash_keys(self) -> tuple:
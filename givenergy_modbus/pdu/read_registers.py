@@ -1,4 +1,5 @@
 from abc import ABC
+import functools
 import logging
 from typing import ClassVar, Iterator
 
@@ -19,16 +20,31 @@ from ..model.register import Register, IR, HR
 _logger = logging.getLogger(__name__)
 
 
+# Responses arrive for the same few register blocks over and over, so
+# keep the Register keys for each block rather than building new ones
+# for every value of every response.
+@functools.lru_cache(maxsize=64)
+def _register_keys(cls: type[Register], base: int, count: int) -> tuple[Register, ...]:
+    """Return the registers cls(base) ... cls(base + count - 1)."""
+    return tuple(cls(idx) for idx in range(base, base + count))
+
+
 class ReadRegistersMessage(TransparentMessage, ABC):
     """Mixin for commands that specify base register and register count semantics."""
 
     base_register: int
     register_count: int
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.base_register = kwargs.get("base_register", 0)
-        self.register_count = kwargs.get("register_count", 0)
+    def __init__(
+        self,
+        base_register: int = 0,
+        register_count: int = 0,
+        slave_address: int = 0x32,
+        **kwargs,
+    ):
+        super().__init__(slave_address=slave_address, **kwargs)
+        self.base_register = base_register
+        self.register_count = register_count
 
     @classmethod
     def decode_transparent_function(
@@ -37,9 +53,9 @@ class ReadRegistersMessage(TransparentMessage, ABC):
         attrs["base_register"] = decoder.decode_16bit_uint()
         attrs["register_count"] = decoder.decode_16bit_uint()
         if issubclass(cls, ReadRegistersResponse) and not attrs.get("error", False):
-            attrs["register_values"] = [
-                decoder.decode_16bit_uint() for _ in range(attrs["register_count"])
-            ]
+            attrs["register_values"] = decoder.decode_16bit_uints(
+                attrs["register_count"]
+            )
         attrs["check"] = decoder.decode_16bit_uint()
         return cls(**attrs)
 
@@ -58,7 +74,7 @@ class ReadRegistersMessage(TransparentMessage, ABC):
         if self.register_count is None:
             raise InvalidPduState("Register count must be set", self)
         if self.register_count == 0 and not self.error:
-            _logger.warning(f"Register count of 0 does not make sense: {self}")
+            _logger.warning("Register count of 0 does not make sense: %s", self)
 
 
 class ReadRegistersRequest(ReadRegistersMessage, TransparentRequest, ABC):
@@ -86,7 +102,7 @@ class ReadRegistersRequest(ReadRegistersMessage, TransparentRequest, ABC):
 
         if self.register_count != 1 and self.base_register % 60 != 0:
             _logger.warning(
-                f"Base register {self.base_register} not aligned on 60-byte boundary"
+                "Base register %d not aligned on 60-byte boundary", self.base_register
             )
         if self.register_count <= 0 or 60 < self.register_count:
             raise InvalidPduState("Register count must be in (0,60]", self)
@@ -103,14 +119,13 @@ class ReadRegistersResponse(ReadRegistersMessage, TransparentResponse, ABC):
     # required by dict.update()
     def enumerate(self) -> Iterator[tuple[Register, int]]:
         """Generate pairs of (register, value) from the message."""
-        idx = self.base_register
-        cls = self.register_class
-        for val in self.register_values:
-            yield cls(idx), val
-            idx += 1
-
-    def __init__(self, **kwargs) -> None:
-        super().__init__(**kwargs)
+        keys = _register_keys(
+            self.register_class, self.base_register, len(self.register_values)
+        )
+        return zip(keys, self.register_values)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
         self.register_values: list[int] = kwargs.get("register_values", [])
 
     def _encode_function_data(self) -> None:
@@ -136,7 +151,10 @@ class ReadRegistersResponse(ReadRegistersMessage, TransparentResponse, ABC):
         expected_padding = 0x12 if self.error else 0x8A
         if self.padding != expected_padding:
             _logger.debug(
-                f"Expected padding 0x{expected_padding:02x}, found 0x{self.padding:02x} instead: {self}"
+                "Expected padding 0x%02x, found 0x%02x instead: %s",
+                expected_padding,
+                self.padding,
+                self,
             )
 
         # FIXME how to test crc
@@ -195,9 +213,7 @@ class ReadHoldingRegistersRequest(ReadHoldingRegisters, ReadRegistersRequest):
 
     def expected_response(self):
         return ReadHoldingRegistersResponse(
-            base_register=self.base_register,
-            register_count=self.register_count,
-            slave_address=self.slave_address,
+            self.base_register, self.register_count, self.slave_address
         )
 
 
@@ -221,9 +237,7 @@ class ReadInputRegistersRequest(ReadInputRegisters, ReadRegistersRequest):
 
     def expected_response(self):
         return ReadInputRegistersResponse(
-            base_register=self.base_register,
-            register_count=self.register_count,
-            slave_address=self.slave_address,
+            self.base_register, self.register_count, self.slave_address
         )
 
 
@@ -247,9 +261,7 @@ class ReadBatteryInputRegistersRequest(ReadBatteryInputRegisters, ReadRegistersR
 
     def expected_response(self):
         return ReadBatteryInputRegistersResponse(
-            base_register=self.base_register,
-            register_count=self.register_count,
-            slave_address=self.slave_address,
+            self.base_register, self.register_count, self.slave_address
         )
 
 
@@ -1,3 +1,4 @@
+import functools
 import logging
 from abc import ABC
 
@@ -22,16 +23,24 @@ class TransparentMessage(BasePDU, ABC):
     padding: int
     check: int
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        *,
+        slave_address: int = 0x32,
+        error: bool = False,
+        padding: int = 0x08,  # this does seem significant
+        check: int = 0x0000,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
-        self.slave_address = kwargs.get("slave_address", 0x32)
-        self.error = kwargs.get("error", False)
-        self.padding = kwargs.get("padding", 0x08)  # this does seem significant
-        self.check = kwargs.get("check", 0x0000)
+        self.slave_address = slave_address
+        self.error = error
+        self.padding = padding
+        self.check = check
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-        _logger.debug(f"TransparentMessage.__init_subclass__({cls.__name__})")
+        _logger.debug("TransparentMessage.__init_subclass__(%s)", cls.__name__)
 
     def __str__(self) -> str:
         def format_kv(key, val):
@@ -129,29 +138,41 @@ class TransparentMessage(BasePDU, ABC):
 class TransparentRequest(TransparentMessage, ClientOutgoingMessage, ABC):
     """Root of the hierarchy for Transparent Request PDUs."""
 
+    # Built on first use, since the imports would be circular at module level
     @classmethod
-    def lookup_transparent_function_decoder(
-        cls, transparent_function_code: int
-    ) -> type["TransparentRequest"]:
+    @functools.cache
+    def _transparent_function_decoders(cls) -> dict[int, type["TransparentRequest"]]:
         from .import (
             ReadBatteryInputRegistersRequest,
             ReadHoldingRegistersRequest,
             ReadInputRegistersRequest,
             WriteHoldingRegisterRequest,
+            WriteHoldingRegistersRequest,
         )
 
-        if transparent_function_code == 3:
-            return ReadHoldingRegistersRequest
-        elif transparent_function_code == 4:
-            return ReadInputRegistersRequest
-        elif transparent_function_code == 6:
-            return WriteHoldingRegisterRequest
-        elif transparent_function_code == 0x16:
-            return ReadBatteryInputRegistersRequest
-        else:
+        return {
+            c.transparent_function_code: c
+            for c in (
+                ReadHoldingRegistersRequest,
+                ReadInputRegistersRequest,
+                WriteHoldingRegisterRequest,
+                WriteHoldingRegistersRequest,
+                ReadBatteryInputRegistersRequest,
+            )
+        }
+
+    @classmethod
+    def lookup_transparent_function_decoder(
+        cls, transparent_function_code: int
+    ) -> type["TransparentRequest"]:
+        decoder_class = cls._transparent_function_decoders().get(
+            transparent_function_code
+        )
+        if decoder_class is None:
             raise NotImplementedError(
                 f"TransparentRequest function #{transparent_function_code} decoder"
             )
+        return decoder_class
 
     def expected_response(self) -> "TransparentResponse":
         """Create a template of a correctly shaped Response expected for this Request."""
@@ -171,32 +192,43 @@ class TransparentResponse(TransparentMessage, ClientIncomingMessage, ABC):
         super()._encode_function_data()
         self._builder.add_string(self.inverter_serial_number, 10)
 
+    # Built on first use, since the imports would be circular at module level
     @classmethod
-    def lookup_transparent_function_decoder(
-        cls, transparent_function_code: int
-    ) -> type["TransparentResponse"]:
+    @functools.cache
+    def _transparent_function_decoders(cls) -> dict[int, type["TransparentResponse"]]:
         from .import (
             NullResponse,
             ReadBatteryInputRegistersResponse,
             ReadHoldingRegistersResponse,
             ReadInputRegistersResponse,
             WriteHoldingRegisterResponse,
+            WriteHoldingRegistersResponse,
         )
 
-        if transparent_function_code == 0:
-            return NullResponse
-        elif transparent_function_code == 3:
-            return ReadHoldingRegistersResponse
-        elif transparent_function_code == 4:
-            return ReadInputRegistersResponse
-        elif transparent_function_code == 6:
-            return WriteHoldingRegisterResponse
-        elif transparent_function_code == 0x16:
-            return ReadBatteryInputRegistersResponse
-        else:
+        return {
+            c.transparent_function_code: c
+            for c in (
+                NullResponse,
+                ReadHoldingRegistersResponse,
+                ReadInputRegistersResponse,
+                WriteHoldingRegisterResponse,
+                WriteHoldingRegistersResponse,
+                ReadBatteryInputRegistersResponse,
+            )
+        }
+
+    @classmethod
+    def lookup_transparent_function_decoder(
+        cls, transparent_function_code: int
+    ) -> type["TransparentResponse"]:
+        decoder_class = cls._transparent_function_decoders().get(
+            transparent_function_code
+        )
+        if decoder_class is None:
             raise NotImplementedError(
                 f"TransparentResponse function #{transparent_function_code} decoder"
             )
+        return decoder_class
 
     def _update_check_code(self):
         if hasattr(self, "check"):
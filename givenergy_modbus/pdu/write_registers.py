@@ -1,5 +1,6 @@
 import logging
 from abc import ABC
+from typing import Optional
 
 from ..codec import (
     PayloadDecoder,
@@ -118,4 +119,129 @@ class WriteHoldingRegisterResponse(WriteHoldingRegister, TransparentResponse):
         super().ensure_valid_state()
 
 
+class WriteHoldingRegisters(TransparentMessage, ABC):
+    """Request & Response PDUs for function #16/Write Multiple Holding Registers."""
+
+    transparent_function_code = 0x10
+
+    base_register: int
+    register_count: int
+
+    def __init__(self, base_register: int = 0, register_count: int = 0, **kwargs):
+        kwargs["slave_address"] = kwargs.get("slave_address", 0x11)
+        super().__init__(**kwargs)
+        self.base_register = base_register
+        self.register_count = register_count
+
+    def _extra_shape_hash_keys(self) -> tuple:
+        return super()._extra_shape_hash_keys() + (
+            self.base_register,
+            self.register_count,
+        )
+
+    def ensure_valid_state(self):
+        """Sanity check our internal state."""
+        super().ensure_valid_state()
+        if self.base_register < 0 or 0xFFFF < self.base_register:
+            raise InvalidPduState("Base register must be an unsigned 16-bit int", self)
+        if not self.error and (self.register_count <= 0 or 123 < self.register_count):
+            raise InvalidPduState("Register count must be in (0,123]", self)
+
+
+class WriteHoldingRegistersRequest(WriteHoldingRegisters, TransparentRequest):
+    """Concrete PDU implementation for handling function #16/Write Multiple Holding Registers request messages."""
+
+    register_values: list[int]
+
+    def __init__(
+        self,
+        base_register: int = 0,
+        register_values: Optional[list[int]] = None,
+        **kwargs,
+    ):
+        if register_values is None:
+            register_values = []
+        kwargs.setdefault("register_count", len(register_values))
+        super().__init__(base_register, **kwargs)
+        self.register_values = register_values
+
+    def __eq__(self, o: object) -> bool:
+        return (
+            isinstance(o, type(self))
+            and self.has_same_shape(o)
+            and o.register_values == self.register_values
+        )
+
+    def _encode_function_data(self):
+        super()._encode_function_data()
+        self._builder.add_16bit_uint(self.base_register)
+        self._builder.add_16bit_uint(self.register_count)
+        self._builder.add_8bit_uint(2 * self.register_count)
+        for v in self.register_values:
+            self._builder.add_16bit_uint(v)
+        self._update_check_code()
+
+    @classmethod
+    def decode_transparent_function(
+        cls, decoder: PayloadDecoder, **attrs
+    ) -> "WriteHoldingRegistersRequest":
+        attrs["base_register"] = decoder.decode_16bit_uint()
+        attrs["register_count"] = decoder.decode_16bit_uint()
+        decoder.decode_8bit_uint()  # byte count, implied by register count
+        attrs["register_values"] = decoder.decode_16bit_uints(attrs["register_count"])
+        attrs["check"] = decoder.decode_16bit_uint()
+        return cls(**attrs)
+
+    def _update_check_code(self):
+        crc_builder = PayloadEncoder()
+        crc_builder.add_8bit_uint(self.slave_address)
+        crc_builder.add_8bit_uint(self.transparent_function_code)
+        crc_builder.add_16bit_uint(self.base_register)
+        crc_builder.add_16bit_uint(self.register_count)
+        crc_builder.add_8bit_uint(2 * self.register_count)
+        for v in self.register_values:
+            crc_builder.add_16bit_uint(v)
+        self.check = crc_builder.crc
+        self.check = int.from_bytes(self.check.to_bytes(2, "little"), "big")
+        self._builder.add_16bit_uint(self.check)
+
+    def ensure_valid_state(self):
+        """Sanity check our internal state."""
+        super().ensure_valid_state()
+        if self.register_count != len(self.register_values):
+            raise InvalidPduState(
+                f"register_count={self.register_count} but len(register_values)={len(self.register_values)}.",
+                self,
+            )
+        for v in self.register_values:
+            if v < 0 or 0xFFFF < v:
+                raise InvalidPduState(
+                    f"Value {v} must be an unsigned 16-bit int", self
+                )
+
+    def expected_response(self):
+        return WriteHoldingRegistersResponse(
+            self.base_register, self.register_count, slave_address=self.slave_address
+        )
+
+
+class WriteHoldingRegistersResponse(WriteHoldingRegisters, TransparentResponse):
+    """Concrete PDU implementation for handling function #16/Write Multiple Holding Registers response messages."""
+
+    def _encode_function_data(self):
+        super()._encode_function_data()
+        self._builder.add_16bit_uint(self.base_register)
+        self._builder.add_16bit_uint(self.register_count)
+        self._update_check_code()
+
+    @classmethod
+    def decode_transparent_function(
+        cls, decoder: PayloadDecoder, **attrs
+    ) -> "WriteHoldingRegistersResponse":
+        attrs["base_register"] = decoder.decode_16bit_uint()
+        attrs["register_count"] = decoder.decode_16bit_uint()
+        attrs["check"] = decoder.decode_16bit_uint()
+        return cls(**attrs)
+
+
 __all__ = ()
@@ -1,12 +1,20 @@
 import asyncio
+import dataclasses
 import datetime
+import pickle
 from asyncio import StreamReader
 
 import pytest
 
 from givenergy_modbus.client.client import Client
 from givenergy_modbus.model import TimeSlot
-from givenergy_modbus.pdu.write_registers import WriteHoldingRegisterRequest, WriteHoldingRegisterResponse
+from givenergy_modbus.model.register import HR
+from givenergy_modbus.pdu.write_registers import (
+    WriteHoldingRegisterRequest,
+    WriteHoldingRegisterResponse,
+    WriteHoldingRegistersRequest,
+    WriteHoldingRegistersResponse,
+)
 
 
 async def test_expected_response():
@@ -41,6 +49,28 @@ async def test_expected_response():
     assert expected_res == res
 
 
+async def test_write_registers_updates_cache():
+    """Ensure the values of an acked write-multiple request end up in the register cache."""
+    client = Client(host='foo', port=4321)
+    client.expected_responses = {}
+    req = WriteHoldingRegistersRequest(94, [100, 200])
+    client.reader = StreamReader()
+    network_consumer = asyncio.create_task(client._task_network_consumer())
+    send_and_wait = asyncio.create_task(client.send_request_and_await_response(req, timeout=0.1, retries=0))
+
+    _, tx_fut = await client.tx_queue.get()
+    client.tx_queue.task_done()
+    tx_fut.set_result(True)
+
+    client.reader.feed_data(
+        WriteHoldingRegistersResponse(94, 2, inverter_serial_number='', slave_address=0x11).encode()
+    )
+    client.reader.feed_eof()
+    await asyncio.gather(send_and_wait, network_consumer)
+
+    assert client.plant.register_caches[0x32] == {HR(94): 100, HR(95): 200}
+
+
 def test_timeslot():
     ts = TimeSlot(datetime.time(4, 5), datetime.time(9, 8))
     assert ts == TimeSlot(start=datetime.time(4, 5), end=datetime.time(9, 8))
@@ -49,6 +79,13 @@ def test_timeslot():
     assert ts == TimeSlot.from_repr(405, 908)
     assert ts == TimeSlot.from_repr('405', '908')
     assert TimeSlot(datetime.time(0, 2), datetime.time(0, 2)) == TimeSlot.from_repr(2, 2)
+    assert TimeSlot.from_repr(2, 2) is TimeSlot.from_repr(2, 2)
+    # the derived values don't change the dataclass shape
+    assert [f.name for f in dataclasses.fields(ts)] == ['start', 'end']
+    assert dataclasses.asdict(ts) == {'start': datetime.time(4, 5), 'end': datetime.time(9, 8)}
+    assert repr(ts) == 'TimeSlot(start=datetime.time(4, 5), end=datetime.time(9, 8))'
+    assert (ts.start_hhmm, ts.end_hhmm) == (405, 908)
+    assert pickle.loads(pickle.dumps(ts)) == ts
     with pytest.raises(ValueError, match='hour must be in 0..23'):
         TimeSlot.from_repr(999999, 999999)
     with pytest.raises(ValueError, match='minute must be in 0..59'):
@@ -80,6 +117,13 @@ def test_timeslot():
     assert datetime.time(0, 30) in ts
     assert datetime.time(0, 39) in ts
     assert datetime.time(0, 40) not in ts
+    # invalid (hours * 100 + minute) values are rejected, not silently wrapped
+    with pytest.raises(ValueError, match='minute must be in 0..59'):
+        assert 99 in TimeSlot(datetime.time(0, 30), datetime.time(4, 30))
+    with pytest.raises(ValueError, match='hour must be in 0..23'):
+        assert -5 in ts
+    with pytest.raises(ValueError, match='hour must be in 0..23'):
+        assert 2460 in ts
     
     ts = TimeSlot(datetime.time(11, 30), datetime.time(13, 40))
     assert 1129 not in ts
@@ -101,3 +145,8 @@ def test_timeslot():
     assert 0 in ts
     assert 529 in ts
     assert 530 not in ts
+
+    ts = TimeSlot(datetime.time(5, 30), datetime.time(5, 30))
+    assert 529 not in ts
+    assert 530 not in ts
+    assert datetime.time(5, 30) not in ts
@@ -1,10 +1,13 @@
+import asyncio
+from asyncio import StreamReader
+
 import arrow
 import pytest
 
 from givenergy_modbus.client.client import Client
 from givenergy_modbus.model import TimeSlot
 from givenergy_modbus.model.inverter import BatteryPauseMode
-from givenergy_modbus.pdu import WriteHoldingRegisterRequest
+from givenergy_modbus.pdu import WriteHoldingRegisterRequest, WriteHoldingRegistersRequest
 
 
 class RegisterMap:
@@ -134,8 +137,10 @@ async def test_set_mode_dynamic():
     assert commands.set_mode_dynamic() == [
         WriteHoldingRegisterRequest(RegisterMap.BATTERY_POWER_MODE, 1),
         WriteHoldingRegisterRequest(RegisterMap.BATTERY_SOC_RESERVE, 4),
-        WriteHoldingRegisterRequest(RegisterMap.ENABLE_DISCHARGE, False),
+        WriteHoldingRegisterRequest(RegisterMap.ENABLE_DISCHARGE, 0),
     ]
+    # plain ints, not bools, so the requests compare and render the same
+    assert all(type(r.value) is int for r in commands.set_mode_dynamic())
 
 
 async def test_set_mode_storage():
@@ -143,7 +148,7 @@ async def test_set_mode_storage():
     assert commands.set_mode_storage(TimeSlot.from_components(1, 2, 3, 4)) == [
         WriteHoldingRegisterRequest(RegisterMap.BATTERY_POWER_MODE, 1),
         WriteHoldingRegisterRequest(RegisterMap.BATTERY_SOC_RESERVE, 100),
-        WriteHoldingRegisterRequest(RegisterMap.ENABLE_DISCHARGE, True),
+        WriteHoldingRegisterRequest(RegisterMap.ENABLE_DISCHARGE, 1),
         WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_1_START, 102),
         WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_1_END, 304),
         WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_2_START, 0),
@@ -153,17 +158,18 @@ async def test_set_mode_storage():
     assert commands.set_mode_storage(TimeSlot.from_components(5, 6, 7, 8), TimeSlot.from_components(9, 10, 11, 12)) == [
         WriteHoldingRegisterRequest(RegisterMap.BATTERY_POWER_MODE, 1),
         WriteHoldingRegisterRequest(RegisterMap.BATTERY_SOC_RESERVE, 100),
-        WriteHoldingRegisterRequest(RegisterMap.ENABLE_DISCHARGE, True),
+        WriteHoldingRegisterRequest(RegisterMap.ENABLE_DISCHARGE, 1),
         WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_1_START, 506),
         WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_1_END, 708),
         WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_2_START, 910),
         WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_2_END, 1112),
     ]
+    assert all(type(r.value) is int for r in commands.set_mode_storage())
 
     assert commands.set_mode_storage(TimeSlot.from_repr(1314, 1516), discharge_for_export=True) == [
         WriteHoldingRegisterRequest(RegisterMap.BATTERY_POWER_MODE, 0),
         WriteHoldingRegisterRequest(RegisterMap.BATTERY_SOC_RESERVE, 100),
-        WriteHoldingRegisterRequest(RegisterMap.ENABLE_DISCHARGE, True),
+        WriteHoldingRegisterRequest(RegisterMap.ENABLE_DISCHARGE, 1),
         WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_1_START, 1314),
         WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_1_END, 1516),
         WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_2_START, 0),
@@ -198,17 +204,179 @@ async def test_set_charge_and_discharge_limits():
 async def test_set_system_time():
     """Ensure set_system_time emits the correct requests."""
     assert commands.set_system_date_time(arrow.get(year=2022, month=11, day=23, hour=4, minute=34, second=59)) == [
-        WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_YEAR, 22, slave_address=0x11),
-        WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_MONTH, 11, slave_address=0x11),
-        WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_DAY, 23, slave_address=0x11),
-        WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_HOUR, 4, slave_address=0x11),
-        WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_MINUTE, 34, slave_address=0x11),
-        WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_SECOND, 59, slave_address=0x11),
+        WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_YEAR, 22),
+        WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_MONTH, 11),
+        WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_DAY, 23),
+        WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_HOUR, 4),
+        WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_MINUTE, 34),
+        WriteHoldingRegisterRequest(RegisterMap.SYSTEM_TIME_SECOND, 59),
+    ]
+    # merging them into one write is opt-in
+    assert commands.coalesce(
+        commands.set_system_date_time(arrow.get(year=2022, month=11, day=23, hour=4, minute=34, second=59))
+    ) == [
+        WriteHoldingRegistersRequest(RegisterMap.SYSTEM_TIME_YEAR, [22, 11, 23, 4, 34, 59], slave_address=0x11),
     ]
 
 
+def test_coalesce():
+    """Ensure only in-order runs of adjacent register writes get merged."""
+    assert commands.coalesce(
+        [
+            WriteHoldingRegisterRequest(RegisterMap.BATTERY_SOC_RESERVE, 4),
+            WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_1_START, 1600),
+            WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_1_END, 700),
+            WriteHoldingRegisterRequest(RegisterMap.CHARGE_SLOT_1_END, 430),
+            WriteHoldingRegisterRequest(RegisterMap.CHARGE_SLOT_1_START, 30),
+            WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_2_START, 0),
+            WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_2_END, 0, slave_address=0x32),
+        ]
+    ) == [
+        WriteHoldingRegisterRequest(RegisterMap.BATTERY_SOC_RESERVE, 4, slave_address=0x11),
+        WriteHoldingRegistersRequest(RegisterMap.DISCHARGE_SLOT_1_START, [1600, 700], slave_address=0x11),
+        WriteHoldingRegisterRequest(RegisterMap.CHARGE_SLOT_1_END, 430, slave_address=0x11),
+        WriteHoldingRegisterRequest(RegisterMap.CHARGE_SLOT_1_START, 30, slave_address=0x11),
+        WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_2_START, 0, slave_address=0x11),
+        WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_2_END, 0, slave_address=0x32),
+    ]
+
+
+@pytest.mark.parametrize('number_batteries', range(4))
+def test_refresh_plant_data(number_batteries: int):
+    """Ensure refresh_plant_data asks for exactly the expected register blocks."""
+
+    def shapes(requests):
+        return [(type(r).__name__, r.base_register, r.register_count, r.slave_address) for r in requests]
+
+    batteries = [('ReadInputRegistersRequest', 60, 60, 0x32 + i) for i in range(number_batteries)]
+    requests = commands.refresh_plant_data(False, number_batteries)
+    assert shapes(requests) == [
+        ('ReadInputRegistersRequest', 0, 60, 0x32),
+        ('ReadInputRegistersRequest', 180, 60, 0x32),
+    ] + batteries
+
+    # a complete refresh probes for every possible battery
+    batteries = [('ReadInputRegistersRequest', 60, 60, 0x32 + i) for i in range(number_batteries + 1)]
+    assert shapes(commands.refresh_plant_data(True, max_batteries=number_batteries + 1)) == [
+        ('ReadInputRegistersRequest', 0, 60, 0x32),
+        ('ReadInputRegistersRequest', 180, 60, 0x32),
+        ('ReadHoldingRegistersRequest', 0, 60, 0x32),
+        ('ReadHoldingRegistersRequest', 60, 60, 0x32),
+        ('ReadHoldingRegistersRequest', 120, 60, 0x32),
+        ('ReadInputRegistersRequest', 120, 60, 0x32),
+    ] + batteries
+
+    # callers get their own list, and requests, to modify
+    requests.append(None)
+    again = commands.refresh_plant_data(False, number_batteries)
+    assert len(again) == 2 + number_batteries
+    assert again[0] is not requests[0]
+
+
 async def test_set_inverter_reboot():
     """Ensure set_inverter_reboot emits the correct requests."""
     assert commands.set_inverter_reboot() == [
         WriteHoldingRegisterRequest(RegisterMap.REBOOT, 100, slave_address=0x11),
     ]
+    # each call gets its own request, so callers can't affect each other
+    assert commands.set_inverter_reboot()[0] is not commands.set_inverter_reboot()[0]
+
+
+def test_fabricated_methods_are_installed():
+    """Ensure fabricated setters become ordinary methods after first use."""
+    from givenergy_modbus.client.commands import Commands
+
+    commands.set_battery_soc_reserve(50)
+    assert 'set_battery_soc_reserve' in Commands.__dict__
+    assert client.commands.set_battery_soc_reserve.__func__ is Commands.set_battery_soc_reserve
+    commands.reset_charge_slot_1()
+    assert 'reset_charge_slot_1' in Commands.__dict__
+
+    with pytest.raises(AttributeError):
+        commands.set_no_such_register(1)
+
+
+async def test_set_system_time_out_of_range():
+    """Ensure dates that cannot be represented by the inverter are rejected."""
+    with pytest.raises(ValueError, match=r'-1 out of range for system_time_year'):
+        commands.set_system_date_time(arrow.get(year=1999, month=12, day=31))
+
+
+def test_gendoc():
+    """Ensure the generated docstring lists fabricated methods and is only built once."""
+    from givenergy_modbus.client.commands import Commands
+
+    doc = Commands.__doc__
+    assert '* set_battery_soc_reserve()\n' in doc
+    assert '* set_charge_slot_1()\n* reset_charge_slot_1()\n' in doc
+    assert Commands.__doc__ is doc
+
+
+def test_skip_unchanged():
+    """Ensure writes are only dropped when the cache already holds the values."""
+    from givenergy_modbus.model.register import HR
+
+    c = Client('foo', 1234)
+    requests = c.commands.set_mode_storage(TimeSlot.from_repr(1600, 700))
+    assert c.commands.skip_unchanged(requests) == requests
+
+    c.plant.register_caches[0x32].update(
+        {
+            HR(RegisterMap.BATTERY_POWER_MODE): 1,
+            HR(RegisterMap.BATTERY_SOC_RESERVE): 100,
+            HR(RegisterMap.DISCHARGE_SLOT_1_START): 1600,
+            HR(RegisterMap.DISCHARGE_SLOT_1_END): 700,
+            HR(RegisterMap.DISCHARGE_SLOT_2_START): 0,
+        }
+    )
+    assert c.commands.skip_unchanged(requests) == [
+        WriteHoldingRegisterRequest(RegisterMap.ENABLE_DISCHARGE, 1),
+        WriteHoldingRegisterRequest(RegisterMap.DISCHARGE_SLOT_2_END, 0),
+    ]
+
+
+async def _send_and_ack(client: Client, request):
+    """Send a request through the client, and feed back the inverter's ack."""
+    client.reader = StreamReader()
+    network_consumer = asyncio.create_task(client._task_network_consumer())
+    send_and_wait = asyncio.create_task(client.send_request_and_await_response(request, timeout=0.1, retries=0))
+
+    _, tx_fut = await client.tx_queue.get()
+    client.tx_queue.task_done()
+    tx_fut.set_result(True)
+
+    ack = request.expected_response()
+    ack.inverter_serial_number = ''
+    client.reader.feed_data(ack.encode())
+    client.reader.feed_eof()
+    await asyncio.gather(send_and_wait, network_consumer)
+
+
+async def test_skip_unchanged_after_write():
+    """Ensure a write that has been acked is not skipped when restoring the old value."""
+    from givenergy_modbus.model.register import HR
+
+    c = Client('foo', 1234)
+    c.expected_responses = {}
+    restore = c.commands.set_charge_slot_1(TimeSlot.from_repr(30, 430))
+    c.plant.register_caches[0x32].update(
+        {HR(RegisterMap.CHARGE_SLOT_1_START): 30, HR(RegisterMap.CHARGE_SLOT_1_END): 430}
+    )
+    assert c.commands.skip_unchanged(restore) == []
+
+    for req in c.commands.set_charge_slot_1(TimeSlot.from_repr(100, 200)):
+        await _send_and_ack(c, req)
+    assert c.commands.skip_unchanged(restore) == restore
+
+    # and likewise for a write-multiple request
+    restore = c.commands.coalesce(
+        c.commands.set_system_date_time(arrow.get(year=2022, month=11, day=23, hour=4, minute=34, second=59))
+    )
+    for req in restore:
+        await _send_and_ack(c, req)
+    assert c.commands.skip_unchanged(restore) == []
+    for req in c.commands.coalesce(
+        c.commands.set_system_date_time(arrow.get(year=2023, month=1, day=2, hour=3, minute=4, second=5))
+    ):
+        await _send_and_ack(c, req)
+    assert c.commands.skip_unchanged(restore) == restore
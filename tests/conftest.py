@@ -17,6 +17,8 @@ from givenergy_modbus.pdu import (
     ReadInputRegistersResponse,
     WriteHoldingRegisterRequest,
     WriteHoldingRegisterResponse,
+    WriteHoldingRegistersRequest,
+    WriteHoldingRegistersResponse,
 )
 from tests.model.test_register import HOLDING_REGISTERS, INPUT_REGISTERS
 
@@ -278,6 +280,27 @@ _server_messages: PduTestCases = [
         b'AB1234G567' b'\x00\x00\x00\x00\x00\x00\x00\x08' b'\x32\x06\x00\x14\x00\x01' b'\x0d\xcd',
         None,
     ),
+    (
+        '2:16/WriteHoldingRegistersRequest(slave_address=0x32 base_register=35 register_count=6)',
+        WriteHoldingRegistersRequest,
+        {
+            'base_register': 35,
+            'register_count': 6,
+            'register_values': [22, 11, 23, 4, 34, 59],
+            'check': 0x16DE,
+            'data_adapter_serial_number': 'AB1234G567',
+            'error': False,
+            'padding': 8,
+            'slave_address': 0x32,
+        },
+        b'YY\x00\x01\x00\x29\x01\x02',
+        b'AB1234G567'
+        b'\x00\x00\x00\x00\x00\x00\x00\x08'
+        b'\x32\x10\x00\x23\x00\x06\x0c'
+        b'\x00\x16\x00\x0b\x00\x17\x00\x04\x00\x22\x00\x3b'
+        b'\x16\xde',
+        None,
+    ),
     (
         '1/HeartbeatResponse(data_adapter_serial_number=AB1234G567 data_adapter_type=32)',
         HeartbeatResponse,
@@ -389,6 +412,31 @@ _client_messages: PduTestCases = [
         b'\x8e\x4b',  # 2b crc
         None,
     ),
+    (
+        '2:16/WriteHoldingRegistersResponse(slave_address=0x32 base_register=35 register_count=6)',
+        WriteHoldingRegistersResponse,
+        {
+            'base_register': 35,
+            'register_count': 6,
+            # synthetic: not from a real capture, and we don't know how the
+            # inverter calculates response checks, so this is just a placeholder
+            'check': 0x1234,
+            'inverter_serial_number': 'SA1234G567',
+            'data_adapter_serial_number': 'WF1234G567',
+            'padding': 0x8A,
+            'slave_address': 0x32,
+            'error': False,
+        },
+        b'YY\x00\x01\x00\x26\x01\x02',
+        b'WF1234G567'
+        b'\x00\x00\x00\x00\x00\x00\x00\x8a'
+        b'\x32\x10'
+        b'SA1234G567'
+        b'\x00\x23'  # base register
+        b'\x00\x06'  # register count
+        b'\x12\x34',  # 2b crc
+        None,
+    ),
     (
         '1/HeartbeatRequest(data_adapter_serial_number=WF1234G567 data_adapter_type=1)',
         HeartbeatRequest,
@@ -565,3 +565,20 @@ def test_from_registers_actual_data(register_cache_inverter_daytime_discharging_
     }
     d = { k: v for k, v in i.getall() if k in t }
     assert d == t
+
+
+def test_lookup_writable_register():
+    Inverter._writable_register.cache_clear()
+    assert Inverter.lookup_writable_register('enable_charge', True) == 96
+    assert Inverter.lookup_writable_register('enable_charge', False) == 96
+    assert Inverter._writable_register.cache_info().hits == 1
+    assert Inverter.lookup_writable_register('charge_slot_1_start', 30) == 94
+
+    # failures are not cached, and are raised every time
+    for _ in range(2):
+        with pytest.raises(ValueError, match='serial_number is not writable'):
+            Inverter.lookup_writable_register('serial_number', 0)
+        with pytest.raises(ValueError, match='101 out of range for charge_target_soc'):
+            Inverter.lookup_writable_register('charge_target_soc', 101)
+        with pytest.raises(ValueError, match='1260 is not a valid time'):
+            Inverter.lookup_writable_register('charge_slot_1_end', 1260)
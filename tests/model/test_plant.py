@@ -26,9 +26,12 @@ from givenergy_modbus.pdu import (
     ClientIncomingMessage,
     HeartbeatRequest,
     NullResponse,
+    ReadHoldingRegistersResponse,
     ReadInputRegistersResponse,
     ReadRegistersResponse,
     WriteHoldingRegisterResponse,
+    WriteHoldingRegistersRequest,
+    WriteHoldingRegistersResponse,
 )
 from tests.conftest import CLIENT_MESSAGES, PduTestCaseSig
 
@@ -58,6 +61,36 @@ def test_instantiation():
     #    assert Plant(data_adapter_serial_number='ZX9876', register_caches={0x30: rc}).json() == ''
 
 
+def test_models_are_reused(plant: Plant):
+    """Ensure the models are only rebuilt when the underlying cache changes."""
+    inverter = plant.inverter
+    assert plant.inverter is inverter
+    plant.register_caches[0x32][HR(0)] = 0x2001
+    assert plant.inverter is inverter
+    assert inverter.device_type_code == '2001'
+
+    plant.register_caches[0x32] = RegisterCache()
+    assert plant.inverter is not inverter
+    assert plant.inverter.device_type_code is None
+
+
+def test_update_records_serial_numbers_once(plant: Plant):
+    """Ensure serial numbers are taken from the first response that carries them."""
+    kwargs = {'base_register': 0, 'register_count': 1, 'register_values': [0x2001]}
+    plant.update(
+        ReadHoldingRegistersResponse(
+            inverter_serial_number='SA1234G567', data_adapter_serial_number='WF1234G567', **kwargs
+        )
+    )
+    plant.update(
+        ReadHoldingRegistersResponse(
+            inverter_serial_number='XX9999X999', data_adapter_serial_number='YY9999Y999', **kwargs
+        )
+    )
+    assert plant.inverter_serial_number == 'SA1234G567'
+    assert plant.data_adapter_serial_number == 'WF1234G567'
+
+
 def test_plant(
     plant: Plant,
     register_cache_inverter_daytime_discharging_with_solar_generation,
@@ -133,9 +166,6 @@ async def test_update(
         assert plant.register_caches[pdu.slave_address] == {
             register_type(k): v for k, v in enumerate(pdu.register_values, start=pdu.base_register)
         }
-        assert plant.register_caches[pdu.slave_address] == {
-            register_type(k): v for k, v in enumerate(pdu.register_values, start=pdu.base_register)
-        }
         # assert len(j) > 1400
     elif isinstance(pdu, WriteHoldingRegisterResponse):
         # assert d != orig_plant_dict
@@ -151,6 +181,9 @@ async def test_update(
         #         '}}, ' '"inverter_serial_number": "SA1234G567", ' '"data_adapter_serial_number": "WF1234G567"}',
         #     ]
         # )
+    elif isinstance(pdu, WriteHoldingRegistersResponse):
+        # the ack doesn't carry the values, see test_apply_write
+        assert plant.register_caches == {k: {} for k in expected_caches_keys}
     elif isinstance(pdu, (NullResponse, HeartbeatRequest)):
         assert plant.register_caches == {k: {} for k in expected_caches_keys}
         # assert j == json.dumps(
@@ -165,6 +198,14 @@ async def test_update(
 
 
 
+def test_apply_write(plant: Plant):
+    """Ensure an acknowledged write-multiple request updates the cache."""
+    plant.apply_write(WriteHoldingRegistersRequest(35, [22, 11, 23, 4, 34, 59], slave_address=0x11))
+    assert plant.register_caches == {
+        0x32: {HR(35): 22, HR(36): 11, HR(37): 23, HR(38): 4, HR(39): 34, HR(40): 59}
+    }
+
+
 # TODO: there are now many new inverter registers
 # this currently only tests that those that appear in the test
 # match the calcuted set - extras are ignored
@@ -1,4 +1,7 @@
+import copy
 import json
+import pickle
+from enum import IntEnum
 
 import pytest
 
@@ -63,6 +66,8 @@ def test_register():
     assert {HR(0): 1, IR(1): 2} != {HR(1): 1, IR(2): 2}
     assert HR(1000) == HR(1000)
     assert HR(318) == HR(318)
+    assert HR(318) is HR(318)
+    assert HR(318) is not IR(318)
 
     assert str(HR(22)) == 'HR_22'
     assert str(IR(99)) == 'IR_99'
@@ -74,3 +79,36 @@ def test_register():
     )
     with pytest.raises(TypeError, match='keys must be str, int, float, bool or None, not HR'):
         json.dumps({HR(0): 1234, HR(1): 17185, HR(2): 43981, IR(0): 2}, cls=RegisterEncoder)
+
+
+def test_register_interned():
+    """Ensure copying or unpickling a register gives back the interned instance."""
+    assert copy.copy(HR(7)) is HR(7)
+    assert copy.deepcopy({IR(7): 1}) == {IR(7): 1}
+    assert pickle.loads(pickle.dumps(IR(7))) is IR(7)
+
+
+def test_register_index_normalised():
+    """Ensure the first index used for a register doesn't leak into the interned instance."""
+
+    class Reg(IntEnum):
+        FOO = 9876
+
+    assert HR(Reg.FOO) is HR(9876)
+    assert type(HR(9876)._idx) is int
+    assert repr(HR(9876)) == 'HR_9876'
+    assert IR(True) is IR(1)
+    assert type(IR(1)._idx) is int
+    with pytest.raises(TypeError):
+        HR('12')
+
+
+def test_gendoc():
+    """Ensure generated docstrings are per-class and only built once."""
+    from givenergy_modbus.model.battery import Battery
+    from givenergy_modbus.model.inverter import Inverter
+
+    doc = Inverter.__doc__
+    assert '* battery_soc_reserve\n' in doc
+    assert Inverter.__doc__ is doc
+    assert Battery.__doc__ != doc
@@ -1,5 +1,7 @@
 import datetime
 
+import pytest
+
 from givenergy_modbus.model import TimeSlot
 from givenergy_modbus.model.register import HR, IR
 from givenergy_modbus.model.register_cache import RegisterCache
@@ -16,9 +18,21 @@ def test_register_cache(register_cache):
 def test_to_from_json():
     """Ensure we can unserialize a RegisterCache from JSON."""
     assert RegisterCache.from_json('{"HR(1)": 2, "IR(3)": 4}') == {HR(1): 2, IR(3): 4}
+    rc = RegisterCache({HR(1): 2, IR(3): 4})
+    assert rc.json() == '{"HR:1": 2, "IR:3": 4}'
+    assert RegisterCache.from_json(rc.json()) == rc
 
 
 def test_to_from_json_actual_data(json_inverter_daytime_discharging_with_solar_generation):
     """Ensure we can unserialize a RegisterCache to and from JSON."""
     rc = RegisterCache.from_json(json_inverter_daytime_discharging_with_solar_generation)
     assert len(rc) == 360
+
+
+def test_from_json_bad_keys():
+    """Ensure malformed register keys are rejected or skipped."""
+    with pytest.raises(ValueError, match='XX:1 is not a valid Register type'):
+        RegisterCache.from_json('{"XX:1": 2}')
+    with pytest.raises(ValueError, match='HR1 is not a valid Register type'):
+        RegisterCache.from_json('{"HR1": 2}')
+    assert RegisterCache.from_json('{"HR:x": 2, "IR:3": 4}') == {IR(3): 4}
@@ -30,6 +30,13 @@ def test_decoder_uints():
     with pytest.raises(struct.error, match='unpack requires a buffer of 8 bytes'):
         d.decode_64bit_uint()
 
+    d = PayloadDecoder(b'\x01\x02\x03\x04\x05\x06')
+    assert d.decode_8bit_uint() == 0x01
+    assert d.decode_16bit_uints(2) == [0x0203, 0x0405]
+    assert d.decode_16bit_uints(0) == []
+    with pytest.raises(struct.error, match='for unpacking 4 bytes'):
+        d.decode_16bit_uints(2)
+
 
 def test_decoder_strings():
     d = PayloadDecoder(b'abc')
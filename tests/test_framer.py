@@ -185,7 +185,7 @@ def test_various_short_message_buffers(caplog, buffer):
             assert caplog.records[1].message == f'Buffer ({i}b) insufficient for frame of length 56b, await more data'
         caplog.clear()
         assert framer._buffer == buffer[:i]
-        framer._buffer = b''
+        framer._buffer.clear()
 
 
 def test_process_stream_good():
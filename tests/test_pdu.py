@@ -4,7 +4,7 @@ from typing import Any, Optional
 import pytest
 
 from givenergy_modbus.exceptions import ExceptionBase, InvalidFrame
-from givenergy_modbus.model.register import HR
+from givenergy_modbus.model.register import HR, IR
 from givenergy_modbus.pdu import (
     BasePDU,
     ClientIncomingMessage,
@@ -357,3 +357,12 @@ def test_expected_response():
     assert req.has_same_shape(res) is False
     assert req.expected_response().has_same_shape(res)
     assert res.has_same_shape(req) is False
+
+
+def test_enumerate_reuses_register_keys():
+    """Ensure responses for the same block share their Register keys."""
+    r1 = ReadHoldingRegistersResponse(base_register=60, register_count=3, register_values=[1, 2, 3])
+    r2 = ReadHoldingRegistersResponse(base_register=60, register_count=3, register_values=[4, 5, 6])
+    assert list(r1.enumerate()) == [(HR(60), 1), (HR(61), 2), (HR(62), 3)]
+    assert all(k1 is k2 for (k1, _), (k2, _) in zip(r1.enumerate(), r2.enumerate()))
+    assert dict(ReadInputRegistersResponse(base_register=0, register_values=[7]).enumerate()) == {IR(0): 7}